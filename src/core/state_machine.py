@@ -124,6 +124,12 @@ class HerbCleaningStateMachine(StateMachine):
         self._state_history: list[str] = []
         super().__init__()
 
+        # Precompute reachable target ids per state for can_transition_to
+        self._transitions_from: dict[str, frozenset[str]] = {
+            state.id: frozenset(transition.target.id for transition in state.transitions)
+            for state in self.states
+        }
+
     def on_enter_state(self, state: State) -> None:
         """Called when entering any state."""
         self._state_history.append(state.name)
@@ -189,9 +195,4 @@ class HerbCleaningStateMachine(StateMachine):
         Returns:
             True if transition is valid
         """
-        # Get all possible transitions from current state
-        for transition in self.current_state.transitions:
-            for state in transition.destinations:
-                if state.id == target_state:
-                    return True
-        return False
+        return target_state in self._transitions_from[self.current_state.id]
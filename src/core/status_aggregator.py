@@ -14,7 +14,7 @@ if TYPE_CHECKING:
     from bots.herblore.herblore_states import HerbCleaningStateMachine
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FatigueStatus:
     """Fatigue module status."""
 
@@ -24,7 +24,7 @@ class FatigueStatus:
     session_minutes: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BreakStatus:
     """Break scheduler status."""
 
@@ -35,7 +35,7 @@ class BreakStatus:
     total_break_time: float = 0.0  # seconds
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TimingStatus:
     """Timing status (from recent actions)."""
 
@@ -44,7 +44,7 @@ class TimingStatus:
     fatigue_multiplier: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AttentionStatus:
     """Attention drift status."""
 
@@ -54,7 +54,7 @@ class AttentionStatus:
     effective_chance: float = 0.03  # With fatigue bonus
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SkillCheckStatus:
     """Skill checker status."""
 
@@ -63,7 +63,7 @@ class SkillCheckStatus:
     enabled: bool = True
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SessionStatus:
     """Session status."""
 
@@ -75,7 +75,7 @@ class SessionStatus:
     current_state: str = "idle"
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusSnapshot:
     """Complete snapshot of all module statuses."""
 
@@ -88,6 +88,14 @@ class StatusSnapshot:
     session: SessionStatus = field(default_factory=SessionStatus)
 
 
+# Shared defaults for modules that aren't attached (safe to share: frozen)
+_DEFAULT_FATIGUE = FatigueStatus()
+_DEFAULT_BREAKS = BreakStatus()
+_DEFAULT_ATTENTION = AttentionStatus()
+_DEFAULT_SKILL_CHECK = SkillCheckStatus()
+_DEFAULT_SESSION = SessionStatus()
+
+
 class StatusAggregator:
     """Collects status from all anti-detection modules into a single snapshot."""
 
@@ -120,6 +128,14 @@ class StatusAggregator:
         self._session = session
         self._state_machine = state_machine
 
+        # Resolve optional module hooks once rather than on every snapshot
+        self._get_break_count = getattr(breaks, "get_break_count", None) if breaks else None
+        if self._get_break_count:
+            from osrs_botlib.anti_detection.break_scheduler import BreakType
+            self._micro_break = BreakType.MICRO
+            self._long_break = BreakType.LONG
+        self._timing_has_fatigue = timing is not None and hasattr(timing, "_fatigue_multiplier")
+
         # Track timing for display
         self._last_delay_ms: float = 0.0
         self._delay_history: list[float] = []
@@ -142,55 +158,54 @@ class StatusAggregator:
         Returns:
             StatusSnapshot with all module statuses
         """
-        snapshot = StatusSnapshot()
-
         # Fatigue status
-        if self._fatigue:
-            fatigue_level = self._fatigue.get_fatigue_level()
-            snapshot.fatigue = FatigueStatus(
-                level=fatigue_level,
-                slowdown_multiplier=self._fatigue.get_slowdown_multiplier(),
-                misclick_rate=self._fatigue.get_misclick_rate(),
-                session_minutes=self._fatigue.get_session_duration(),
+        fatigue = _DEFAULT_FATIGUE
+        fatigue_module = self._fatigue
+        if fatigue_module:
+            fatigue = FatigueStatus(
+                level=fatigue_module.get_fatigue_level(),
+                slowdown_multiplier=fatigue_module.get_slowdown_multiplier(),
+                misclick_rate=fatigue_module.get_misclick_rate(),
+                session_minutes=fatigue_module.get_session_duration(),
             )
 
         # Break status
-        if self._breaks:
-            break_type, time_until = self._breaks.time_until_next_break()
-            snapshot.breaks = BreakStatus(
+        breaks = _DEFAULT_BREAKS
+        breaks_module = self._breaks
+        if breaks_module:
+            break_type, time_until = breaks_module.time_until_next_break()
+            get_break_count = self._get_break_count
+            breaks = BreakStatus(
                 next_break_type=break_type.value,
                 time_until_next=time_until,
-                micro_count=self._breaks.get_break_count(
-                    __import__("src.anti_detection.break_scheduler", fromlist=["BreakType"]).BreakType.MICRO
-                ) if hasattr(self._breaks, "get_break_count") else 0,
-                long_count=self._breaks.get_break_count(
-                    __import__("src.anti_detection.break_scheduler", fromlist=["BreakType"]).BreakType.LONG
-                ) if hasattr(self._breaks, "get_break_count") else 0,
-                total_break_time=self._breaks.get_total_break_time(),
+                micro_count=get_break_count(self._micro_break) if get_break_count else 0,
+                long_count=get_break_count(self._long_break) if get_break_count else 0,
+                total_break_time=breaks_module.get_total_break_time(),
             )
 
         # Timing status
         fatigue_mult = 1.0
-        if self._timing and hasattr(self._timing, "_fatigue_multiplier"):
+        if self._timing_has_fatigue:
             fatigue_mult = self._timing._fatigue_multiplier
 
         avg_delay = 0.0
         if self._delay_history:
             avg_delay = sum(self._delay_history) / len(self._delay_history)
 
-        snapshot.timing = TimingStatus(
+        timing = TimingStatus(
             last_delay_ms=self._last_delay_ms,
             avg_delay_ms=avg_delay,
             fatigue_multiplier=fatigue_mult,
         )
 
         # Attention status
+        attention = _DEFAULT_ATTENTION
         if self._attention:
-            fatigue_level = snapshot.fatigue.level if self._fatigue else 0.0
+            fatigue_level = fatigue.level
             base_chance = self._attention.config.drift_chance
             effective_chance = base_chance + (fatigue_level * 0.03)
 
-            snapshot.attention = AttentionStatus(
+            attention = AttentionStatus(
                 drift_count=self._attention.get_drift_count(),
                 last_target="",  # Updated by events
                 drift_chance=base_chance,
@@ -198,21 +213,23 @@ class StatusAggregator:
             )
 
         # Skill check status
+        skill_check = _DEFAULT_SKILL_CHECK
         if self._skill_checker:
-            snapshot.skill_check = SkillCheckStatus(
+            skill_check = SkillCheckStatus(
                 check_count=self._skill_checker.get_check_count(),
                 time_until_next=self._skill_checker.time_until_next_check(),
                 enabled=self._skill_checker.config.enabled,
             )
 
         # Session status
+        session = _DEFAULT_SESSION
         if self._session:
             stats = self._session.get_stats()
             current_state = "idle"
             if self._state_machine:
                 current_state = self._state_machine.get_current_state().value
 
-            snapshot.session = SessionStatus(
+            session = SessionStatus(
                 duration_seconds=self._session.get_session_duration(),
                 herbs_cleaned=stats.herbs_cleaned,
                 herbs_per_hour=stats.herbs_per_hour,
@@ -221,7 +238,15 @@ class StatusAggregator:
                 current_state=current_state,
             )
 
-        return snapshot
+        return StatusSnapshot(
+            timestamp=time.time(),
+            fatigue=fatigue,
+            breaks=breaks,
+            timing=timing,
+            attention=attention,
+            skill_check=skill_check,
+            session=session,
+        )
 
     def format_session_time(self) -> str:
         """Format session duration as HH:MM:SS or MM:SS.
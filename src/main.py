@@ -7,6 +7,7 @@ permanent account bans. This code is for educational purposes only.
 
 import argparse
 import logging
+import shutil
 import sys
 from pathlib import Path
 
@@ -114,14 +115,10 @@ def validate_environment() -> list[str]:
         except ImportError:
             issues.append("pywin32 not found - required for Windows. Run: pip install pywin32")
     else:
-        # Check for xdotool (Linux window detection)
-        try:
-            import subprocess
-            result = subprocess.run(["which", "xdotool"], capture_output=True)
-            if result.returncode != 0:
-                issues.append("xdotool not found - required for Linux. Run: sudo apt install xdotool")
-        except Exception:
-            issues.append("Could not check for xdotool")
+        # Check for xdotool (Linux window detection) - a PATH lookup, no
+        # need to spawn `which`
+        if shutil.which("xdotool") is None:
+            issues.append("xdotool not found - required for Linux. Run: sudo apt install xdotool")
 
     # Check required Python packages
     required_packages = [
@@ -4,6 +4,7 @@ import time
 from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
+from itertools import islice
 from typing import Callable, Optional
 
 
@@ -19,17 +20,14 @@ class EventType(Enum):
     VISION_UPDATE = "vision_update"
 
 
-@dataclass
+@dataclass(slots=True)
 class AntiDetectionEvent:
     """An anti-detection event with metadata."""
 
     event_type: EventType
     timestamp: float = field(default_factory=time.time)
     data: dict = field(default_factory=dict)
-
-    def __post_init__(self):
-        if self.timestamp == 0:
-            self.timestamp = time.time()
+    _formatted_time: Optional[str] = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def age_seconds(self) -> float:
@@ -38,9 +36,12 @@ class AntiDetectionEvent:
 
     def format_time(self) -> str:
         """Format timestamp as MM:SS."""
-        minutes = int(self.timestamp // 60) % 60
-        seconds = int(self.timestamp % 60)
-        return f"{minutes:02d}:{seconds:02d}"
+        # Timestamps never change after creation, so format once
+        if self._formatted_time is None:
+            minutes = int(self.timestamp // 60) % 60
+            seconds = int(self.timestamp % 60)
+            self._formatted_time = f"{minutes:02d}:{seconds:02d}"
+        return self._formatted_time
 
 
 class EventEmitter:
@@ -52,7 +53,8 @@ class EventEmitter:
         Args:
             max_history: Maximum number of events to keep in history
         """
-        self._callbacks: list[Callable[[AntiDetectionEvent], None]] = []
+        # Dict used as an insertion-ordered set (O(1) unsubscribe)
+        self._callbacks: dict[Callable[[AntiDetectionEvent], None], None] = {}
         self._history: deque[AntiDetectionEvent] = deque(maxlen=max_history)
         self._current_event: Optional[AntiDetectionEvent] = None
 
@@ -62,7 +64,7 @@ class EventEmitter:
         Args:
             callback: Function to call when an event occurs
         """
-        self._callbacks.append(callback)
+        self._callbacks[callback] = None
 
     def unsubscribe(self, callback: Callable[[AntiDetectionEvent], None]) -> None:
         """Unsubscribe from events.
@@ -70,8 +72,7 @@ class EventEmitter:
         Args:
             callback: Function to remove from callbacks
         """
-        if callback in self._callbacks:
-            self._callbacks.remove(callback)
+        self._callbacks.pop(callback, None)
 
     def emit(self, event: AntiDetectionEvent) -> None:
         """Emit an event to all subscribers.
@@ -87,7 +88,8 @@ class EventEmitter:
         elif event.event_type == EventType.BREAK_END:
             self._current_event = None
 
-        for callback in self._callbacks:
+        # Snapshot so callbacks may (un)subscribe while being notified
+        for callback in tuple(self._callbacks):
             try:
                 callback(event)
             except Exception:
@@ -183,9 +185,24 @@ class EventEmitter:
         Returns:
             List of recent events, most recent first
         """
-        events = list(self._history)
-        events.reverse()
-        return events[:count]
+        return list(islice(reversed(self._history), count))
+
+    def get_recent_with_now(
+        self, now: float, count: int = 10
+    ) -> list[tuple[AntiDetectionEvent, float]]:
+        """Get recent events paired with their age at a shared reference time.
+
+        Lets render loops read the clock once per frame instead of once
+        per event via age_seconds.
+
+        Args:
+            now: Reference time (from time.time())
+            count: Number of events to return
+
+        Returns:
+            List of (event, age_seconds) tuples, most recent first
+        """
+        return [(event, now - event.timestamp) for event in self.get_recent(count)]
 
     def get_current_event(self) -> Optional[AntiDetectionEvent]:
         """Get the currently active event (e.g., ongoing break).
@@ -1,16 +1,180 @@
 """Human-like mouse movement using Bezier curves."""
 
+import functools
+import itertools
 import math
+import random
 import time
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Union
 
 import numpy as np
 
-from utils import create_rng, gaussian_bounded
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from utils import create_rng, gaussian_bounded, gaussian_bounded_batch
 from .organic_easing import OrganicEasing, OrganicEasingConfig
 from .windmouse import WindMouse, WindMouseConfig
 
+# Ease-in-out-back overshoot constants (c2 = c1 * 1.525, with c1 = 1.70158)
+_EASE_BACK_C2 = 1.70158 * 1.525
+_EASE_BACK_A = _EASE_BACK_C2 + 1.0
+
+
+def _bezier_cubic_into(out, t, p0x, p0y, p1x, p1y, p2x, p2y, p3x, p3y):
+    """Evaluate a cubic Bezier at each t, writing rows into out.
+
+    Scalar loop kernel for Numba; only used when numba is installed.
+    Uses Horner form, so each sample costs 3 multiplies and 3 adds per axis.
+    """
+    # Power-basis coefficients, computed once per curve
+    ax = -p0x + 3.0 * (p1x - p2x) + p3x
+    ay = -p0y + 3.0 * (p1y - p2y) + p3y
+    bx = 3.0 * (p0x - 2.0 * p1x + p2x)
+    by = 3.0 * (p0y - 2.0 * p1y + p2y)
+    cx = 3.0 * (p1x - p0x)
+    cy = 3.0 * (p1y - p0y)
+    for i in range(t.shape[0]):
+        ti = t[i]
+        out[i, 0] = ((ax * ti + bx) * ti + cx) * ti + p0x
+        out[i, 1] = ((ay * ti + by) * ti + cy) * ti + p0y
+
+
+def _bezier_quadratic_into(out, t, p0x, p0y, p1x, p1y, p2x, p2y):
+    """Evaluate a quadratic Bezier at each t, writing rows into out.
+
+    Scalar loop kernel for Numba (Horner form); only used when numba is installed.
+    """
+    ax = p0x - 2.0 * p1x + p2x
+    ay = p0y - 2.0 * p1y + p2y
+    bx = 2.0 * (p1x - p0x)
+    by = 2.0 * (p1y - p0y)
+    for i in range(t.shape[0]):
+        ti = t[i]
+        out[i, 0] = (ax * ti + bx) * ti + p0x
+        out[i, 1] = (ay * ti + by) * ti + p0y
+
+
+def _jitter_into(path, indices, scales):
+    """Offset each path[indices[i]] perpendicular to its next segment, in place.
+
+    scales[i] is the signed offset in pixels; zero-length segments are skipped.
+    Scalar loop kernel for Numba; only used when numba is installed.
+    """
+    for i in range(len(indices)):
+        idx = indices[i]
+        x0 = path[idx, 0]
+        y0 = path[idx, 1]
+        dx = path[idx + 1, 0] - x0
+        dy = path[idx + 1, 1] - y0
+        length = math.sqrt(dx * dx + dy * dy)
+        if length > 0:
+            scale = scales[i] / length
+            path[idx, 0] = x0 - dy * scale
+            path[idx, 1] = y0 + dx * scale
+
+
+def _speed_profile_into(
+    out, progress, base, amplitudes, frequencies, phases, drift_slope, noise,
+    min_factor, factor_range,
+):
+    """Combine base curve, waves, drift and noise into speed factors in out.
+
+    Fuses every speed-profile component, the [0.05, 1] clamp and the scaling
+    into one pass. Scalar loop kernel for Numba; only used when numba is installed.
+    """
+    for i in range(progress.shape[0]):
+        p = progress[i]
+        value = base[i] + drift_slope * p + noise[i] * 0.12
+        for w in range(amplitudes.shape[0]):
+            value += amplitudes[w] * math.sin(frequencies[w] * (p * math.pi) + phases[w])
+        value = min(max(value, 0.05), 1.0)
+        out[i] = min_factor + factor_range * value
+
+
+if NUMBA_AVAILABLE:
+    _bezier_cubic_into = numba.njit(cache=True, fastmath=True)(_bezier_cubic_into)
+    _bezier_quadratic_into = numba.njit(cache=True, fastmath=True)(_bezier_quadratic_into)
+    _jitter_into = numba.njit(cache=True, fastmath=True)(_jitter_into)
+    _speed_profile_into = numba.njit(cache=True, fastmath=True)(_speed_profile_into)
+
+
+@functools.lru_cache(maxsize=32)
+def _uniform_t(num_points: int) -> np.ndarray:
+    """Uniform curve parameters in [0, 1], read-only (a single point sits at t=1).
+
+    Shared by the Bernstein bases and the JIT kernels, so each point count
+    builds its t vector once.
+    """
+    t = np.linspace(0.0, 1.0, num_points) if num_points > 1 else np.ones(num_points)
+    t.flags.writeable = False
+    return t
+
+
+@functools.lru_cache(maxsize=64)
+def _progress_table(num_segments: int) -> tuple[np.ndarray, np.ndarray]:
+    """Per-segment progress i / n and its sin(progress * pi), both read-only.
+
+    Speed profiles for a given segment count reuse the same arrays. float32:
+    speed factors end up as millisecond-scale sleeps, so single precision is
+    ample and halves the work of the elementwise speed-profile math.
+    """
+    progress = (np.arange(num_segments) / num_segments).astype(np.float32)
+    sin_progress = np.sin(progress * np.float32(math.pi))
+    progress.flags.writeable = False
+    sin_progress.flags.writeable = False
+    return progress, sin_progress
+
+
+@functools.lru_cache(maxsize=64)
+def _ema_decay(length: int, smoothness: float) -> np.ndarray:
+    """EMA impulse response smoothness ** k for k in [0, length], float32 and read-only."""
+    decay = (smoothness ** np.arange(length + 1)).astype(np.float32)
+    decay.flags.writeable = False
+    return decay
+
+
+@functools.lru_cache(maxsize=32)
+def _cubic_basis(num_points: int) -> np.ndarray:
+    """Cubic Bernstein basis for uniform t, one (read-only) row per sample.
+
+    The weights depend only on num_points (easing is applied to timing, not
+    to point placement), so each curve is a single (N, 4) @ (4, 2) product.
+    """
+    t = _uniform_t(num_points)
+
+    # Powers built by reuse
+    omt = 1.0 - t
+    omt2 = omt * omt
+    t2 = t * t
+    basis = np.column_stack((
+        omt2 * omt,
+        3.0 * omt2 * t,
+        3.0 * omt * t2,
+        t2 * t,
+    ))
+    basis.flags.writeable = False
+    return basis
+
+
+@functools.lru_cache(maxsize=32)
+def _quadratic_basis(num_points: int) -> np.ndarray:
+    """Quadratic Bernstein basis for uniform t, one (read-only) row per sample."""
+    t = _uniform_t(num_points)
+
+    omt = 1.0 - t
+    basis = np.column_stack((
+        omt * omt,
+        2.0 * omt * t,
+        t * t,
+    ))
+    basis.flags.writeable = False
+    return basis
+
 
 @dataclass
 class MovementConfig:
@@ -66,14 +230,6 @@ class MovementConfig:
     fitts_decel_start: float = 0.8       # Start slowing at 80% of path
 
 
-@dataclass
-class Point:
-    """2D point."""
-
-    x: float
-    y: float
-
-
 class BezierMovement:
     """Generate human-like mouse movement paths using Bezier curves."""
 
@@ -88,6 +244,28 @@ class BezierMovement:
         self._organic_easing = OrganicEasing(self._rng, self.config.organic_easing_config)
         self._windmouse = WindMouse(self.config.windmouse_config, self._rng)
 
+        # Legacy easing sampler, built lazily from config (see _get_random_easing_function)
+        self._easing_key: Optional[tuple] = None
+        self._easing_fns: list[callable] = []
+        self._easing_cum: list[float] = []
+        # Stdlib generator for scalar draws (easing pick, small integer ranges,
+        # single chance rolls), which it serves without NumPy's per-call
+        # overhead. Seeded from _rng so a seeded BezierMovement stays reproducible
+        self._py_random = random.Random(int(self._rng.integers(2**63)))
+
+        # Scratch path buffer reused by generate_path_array (grown on demand).
+        # Safe to share between calls: the float path is rounded into a new
+        # array on return. Not thread-safe - use one BezierMovement per thread
+        self._path_buf = np.empty((0, 2))
+
+    def _path_buffer(self, num_points: int) -> np.ndarray:
+        """Get a (num_points, 2) view of the reusable path buffer."""
+        if num_points < 0:
+            raise ValueError(f"num_points must be non-negative, got {num_points}")
+        if len(self._path_buf) < num_points:
+            self._path_buf = np.empty((num_points, 2))
+        return self._path_buf[:num_points]
+
     def generate_path(
         self,
         start: tuple[int, int],
@@ -97,6 +275,29 @@ class BezierMovement:
     ) -> list[tuple[int, int]]:
         """Generate a human-like path between two points.
 
+        Same as generate_path_array(), materialized as (x, y) tuples.
+
+        Args:
+            start: Starting (x, y) coordinates
+            end: Target (x, y) coordinates
+            num_points: Number of points in the path
+            target_width: Width of target area (for Fitts's Law)
+
+        Returns:
+            List of (x, y) coordinates forming the path
+        """
+        path = self.generate_path_array(start, end, num_points, target_width)
+        return list(map(tuple, path.tolist()))
+
+    def generate_path_array(
+        self,
+        start: tuple[int, int],
+        end: tuple[int, int],
+        num_points: int = 50,
+        target_width: float = 10.0,
+    ) -> np.ndarray:
+        """Generate a human-like path between two points as an integer array.
+
         Uses cubic Bezier curves with randomized control points.
         Includes optional overshoot and correction, micro-corrections, and jitter.
         May use WindMouse algorithm instead based on configuration.
@@ -108,98 +309,147 @@ class BezierMovement:
             target_width: Width of target area (for Fitts's Law)
 
         Returns:
-            List of (x, y) coordinates forming the path
+            (N, 2) int32 array of coordinates forming the path
         """
+        cfg = self.config
+
+        # Every per-move chance roll, drawn at once:
+        # WindMouse, quadratic curve, multi-segment, overshoot, micro-correction
+        (
+            windmouse_roll,
+            quadratic_roll,
+            multi_segment_roll,
+            overshoot_roll,
+            micro_correction_roll,
+        ) = self._rng.random(5).tolist()
+
         # Check if we should use WindMouse instead of Bezier
         if (
-            self.config.windmouse_enabled
-            and self._rng.random() < self.config.windmouse_chance
+            cfg.windmouse_enabled
+            and windmouse_roll < cfg.windmouse_chance
         ):
-            return self._windmouse.get_path_as_tuples(start, end, target_width)
-
-        start_point = Point(float(start[0]), float(start[1]))
-        end_point = Point(float(end[0]), float(end[1]))
-
-        # Calculate distance and direction
-        dx = end_point.x - start_point.x
-        dy = end_point.y - start_point.y
-        distance = math.sqrt(dx * dx + dy * dy)
-
-        if distance < 1:
-            return [end]
+            return np.array(
+                self._windmouse.get_path_as_tuples(start, end, target_width), dtype=np.int32
+            ).reshape(-1, 2)
+
+        # Calculate distance and direction (once - reused by the helpers below)
+        dx = float(end[0] - start[0])
+        dy = float(end[1] - start[1])
+        distance_sq = dx * dx + dy * dy
+
+        # Sub-pixel move: decided on the squared distance, before any sqrt or
+        # array allocation
+        if distance_sq < 1:
+            return np.array((end,), dtype=np.int32)
+
+        # Near-target nudge (under 3px): curvature, overshoot and tremor are
+        # all below pixel resolution, so a short straight line is enough
+        # (plain float math: np.linspace costs more than the whole line)
+        if distance_sq < 9:
+            n = min(num_points, 4)
+            # Same parameters as _uniform_t (a single point sits at the end)
+            ts = [i / (n - 1) for i in range(n)] if n > 1 else [1.0] * n
+            return np.array(
+                [(round(start[0] + dx * t), round(start[1] + dy * t)) for t in ts],
+                dtype=np.int32,
+            ).reshape(-1, 2)
+
+        distance = math.sqrt(distance_sq)
+        start_point = np.array(start, dtype=np.float64)
+        end_point = np.array(end, dtype=np.float64)
+
+        # Short movements don't need a full-resolution path: roughly one
+        # point per 2px is already sub-pixel smooth after rounding
+        num_points = min(num_points, max(4, int(distance * 0.5)))
 
         # Decide curve type:
         # - Quadratic (1 control point): 15% chance - simpler curves
         # - Cubic (2 control points): default - standard curves
         # - Multi-segment (3 control points): rare - only for medium movements
         use_quadratic = (
-            self.config.imperfection_enabled
-            and self._rng.random() < self.config.simple_curve_chance
+            cfg.imperfection_enabled
+            and quadratic_roll < cfg.simple_curve_chance
         )
 
         # Multi-segment curves: only for medium-distance movements (80-250px)
         # Very long movements (>250px) should use simple curves to avoid wild paths
-        multi_segment_chance = self.config.multi_segment_chance
+        multi_segment_chance = cfg.multi_segment_chance
         if distance > 250:
             multi_segment_chance = 0  # Never use multi-segment for very long moves
         elif distance > 150:
             multi_segment_chance *= 0.5  # Reduce chance for longer moves
 
         use_multi_segment = (
-            self.config.imperfection_enabled
+            cfg.imperfection_enabled
             and not use_quadratic
             and 80 < distance < 300  # Only for medium movements
-            and self._rng.random() < multi_segment_chance
+            and multi_segment_roll < multi_segment_chance
         )
 
-        # Check for overshoot
+        # Check for overshoot (real users don't overshoot tiny movements; each
+        # leg also needs at least 2 points of its own)
         overshoot_target = None
-        if self._rng.random() < self.config.overshoot_chance:
-            overshoot_target = self._calculate_overshoot(end_point, dx, dy)
+        if distance >= 40 and num_points >= 4 and overshoot_roll < cfg.overshoot_chance:
+            inv_distance = 1.0 / distance
+            overshoot_target = self._calculate_overshoot(
+                end_point, dx * inv_distance, dy * inv_distance
+            )
 
         # Generate Bezier path
-        if overshoot_target:
+        if overshoot_target is not None:
             # Path to overshoot point - always use cubic for overshoot
-            control1, control2 = self._generate_control_points(start_point, overshoot_target)
-            path1 = self._bezier_curve(
-                start_point, control1, control2, overshoot_target, num_points // 2
+            control1, control2 = self._generate_control_points(
+                start_point, overshoot_target, *self._offset(start_point, overshoot_target)
             )
             # Correction path back to target
             correction_control1, correction_control2 = self._generate_control_points(
-                overshoot_target, end_point
+                overshoot_target, end_point, *self._offset(overshoot_target, end_point)
             )
-            path2 = self._bezier_curve(
-                overshoot_target,
-                correction_control1,
-                correction_control2,
-                end_point,
-                num_points // 2,
+            # Both legs have the same length, so they are evaluated together
+            # and joined on the shared overshoot point
+            leg_points = num_points // 2
+            legs = self._bezier_segments(
+                np.array((
+                    (start_point, control1, control2, overshoot_target),
+                    (overshoot_target, correction_control1, correction_control2, end_point),
+                ), dtype=float),
+                leg_points,
             )
-            path = path1 + path2[1:]  # Avoid duplicate point
+            path = self._path_buffer(2 * leg_points - 1)
+            path[:leg_points] = legs[0]
+            path[leg_points:] = legs[1, 1:]
         elif use_multi_segment:
             # Use 3-4 control points for more complex, organic curves
-            num_controls = self._rng.integers(3, self.config.max_control_points + 1)
-            controls = self._generate_multi_control_points(start_point, end_point, num_controls)
+            num_controls = self._py_random.randrange(3, cfg.max_control_points + 1)
+            controls = self._generate_multi_control_points(
+                start_point, end_point, dx, dy, distance, num_controls
+            )
             path = self._generate_multi_segment_curve(
-                start_point, end_point, controls, num_points
+                start_point, end_point, controls, num_points, distance=distance
             )
         elif use_quadratic:
             # Use simpler quadratic curve with single control point
-            control1, _ = self._generate_control_points(start_point, end_point)
+            control1, _ = self._generate_control_points(
+                start_point, end_point, dx, dy, distance
+            )
             path = self._generate_quadratic_curve(
-                start_point, control1, end_point, num_points
+                start_point, control1, end_point, num_points,
+                out=self._path_buffer(num_points),
             )
         else:
             # Standard cubic curve (2 control points)
-            control1, control2 = self._generate_control_points(start_point, end_point)
+            control1, control2 = self._generate_control_points(
+                start_point, end_point, dx, dy, distance
+            )
             path = self._bezier_curve(
-                start_point, control1, control2, end_point, num_points
+                start_point, control1, control2, end_point, num_points,
+                out=self._path_buffer(num_points),
             )
 
         # Add micro-corrections to mid-path (30% chance)
         if (
-            self.config.imperfection_enabled
-            and self._rng.random() < self.config.micro_correction_chance
+            cfg.imperfection_enabled
+            and micro_correction_roll < cfg.micro_correction_chance
         ):
             path = self.add_micro_corrections(path, end_point)
 
@@ -207,33 +457,73 @@ class BezierMovement:
         path = self.add_jitter_to_path(path, end_point)
 
         # Convert to integer coordinates
-        return [(int(round(p.x)), int(round(p.y))) for p in path]
+        return np.rint(path).astype(np.int32)
+
+    @staticmethod
+    def _offset(start: np.ndarray, end: np.ndarray) -> tuple[float, float, float]:
+        """Get (dx, dy, distance) from start to end as plain floats."""
+        dx = float(end[0] - start[0])
+        dy = float(end[1] - start[1])
+        return dx, dy, math.hypot(dx, dy)
 
     def _generate_control_points(
-        self, start: Point, end: Point
-    ) -> tuple[Point, Point]:
+        self,
+        start: np.ndarray,
+        end: np.ndarray,
+        dx: float,
+        dy: float,
+        distance: float,
+    ) -> np.ndarray:
         """Generate randomized control points for Bezier curve.
 
         Control points are placed perpendicular to the line
         between start and end, with random offsets.
 
         IMPORTANT: Avoids symmetric placement to prevent bot-like curves.
+
+        Args:
+            start: Starting point
+            end: Ending point
+            dx: end - start along x
+            dy: end - start along y
+            distance: Length of (dx, dy)
+
+        Returns:
+            (2, 2) array holding the two control points
         """
-        dx = end.x - start.x
-        dy = end.y - start.y
-        distance = math.sqrt(dx * dx + dy * dy)
 
-        # Perpendicular direction
-        perp_x = -dy / distance if distance > 0 else 0
-        perp_y = dx / distance if distance > 0 else 0
+        # Perpendicular direction (one reciprocal, two multiplies)
+        inv_distance = 1.0 / distance if distance > 0 else 0.0
+        perp_x = -dy * inv_distance
+        perp_y = dx * inv_distance
+
+        imperfect = self.config.imperfection_enabled
+        t_variance = 0.15 if imperfect else 0.1
+        extra_variance = self.config.control_point_variance if imperfect else 0.0
+
+        # Draw every Gaussian this curve needs in one batch, plus the two side rolls
+        (
+            variance_jitter,
+            offset1_unit,
+            offset2_scale,
+            t1_base,
+            t1_jitter,
+            t2_base,
+            t2_jitter,
+        ) = gaussian_bounded_batch(self._rng, (
+            (0.0, extra_variance),
+            (-1.0, 1.0),
+            (0.3, 1.0),
+            (0.25, 0.40),
+            (-t_variance, t_variance),
+            (0.60, 0.80),
+            (-t_variance * 0.7, t_variance * 1.3),
+        ))
+        sign_roll, shape_roll = self._rng.random(2).tolist()
 
         # Random offsets based on distance - with extra variance if imperfections enabled
-        base_variance = self.config.curve_variance
-        if self.config.imperfection_enabled:
-            # Add extra variance from config (Gaussian for natural distribution)
-            base_variance += gaussian_bounded(
-                self._rng, 0, self.config.control_point_variance
-            )
+        # (extra variance from config is Gaussian for natural distribution)
+        base_variance = self.config.curve_variance + variance_jitter
 
         # Scale down variance for longer movements to prevent wild curves
         # Short movements (< 100px): full variance
@@ -245,15 +535,15 @@ class BezierMovement:
         max_offset = distance * base_variance
 
         # Generate asymmetric offsets - avoid mirror symmetry (Gaussian for natural clusters)
-        offset1 = gaussian_bounded(self._rng, -max_offset, max_offset)
+        offset1 = offset1_unit * max_offset
 
         # Make offset2 intentionally different magnitude (not just opposite sign)
         # This breaks the symmetry that makes curves look bot-like
-        offset2_magnitude = gaussian_bounded(self._rng, 0.3, 1.0) * max_offset
-        offset2_sign = 1 if self._rng.random() < 0.5 else -1
+        offset2_magnitude = offset2_scale * max_offset
+        offset2_sign = 1 if sign_roll < 0.5 else -1
 
         # 40% chance: same side (C-curve), 60% chance: different sides (S-curve)
-        if self._rng.random() < 0.4:
+        if shape_roll < 0.4:
             # Same side - makes a C-curve
             offset2 = offset2_sign * offset2_magnitude * (1 if offset1 >= 0 else -1)
         else:
@@ -262,35 +552,29 @@ class BezierMovement:
 
         # ASYMMETRIC t-values: avoid 0.33/0.67 symmetry
         # Use different base positions and variances for each control point
-        t_variance = 0.15 if self.config.imperfection_enabled else 0.1
 
         # First control point: anywhere from 0.2 to 0.45 (biased toward start)
         # Gaussian distribution clusters control points naturally
-        t1_base = gaussian_bounded(self._rng, 0.25, 0.40)
-        t1 = t1_base + gaussian_bounded(self._rng, -t_variance, t_variance)
-        t1 = max(0.15, min(0.50, t1))  # Clamp to valid range
+        t1 = max(0.15, min(0.50, t1_base + t1_jitter))  # Clamp to valid range
 
         # Second control point: anywhere from 0.55 to 0.85 (biased toward end)
         # Use different variance to break symmetry
-        t2_base = gaussian_bounded(self._rng, 0.60, 0.80)
-        t2 = t2_base + gaussian_bounded(self._rng, -t_variance * 0.7, t_variance * 1.3)
-        t2 = max(0.50, min(0.90, t2))  # Clamp to valid range
-
-        control1 = Point(
-            start.x + dx * t1 + perp_x * offset1,
-            start.y + dy * t1 + perp_y * offset1,
-        )
+        t2 = max(0.50, min(0.90, t2_base + t2_jitter))  # Clamp to valid range
 
-        control2 = Point(
-            start.x + dx * t2 + perp_x * offset2,
-            start.y + dy * t2 + perp_y * offset2,
-        )
-
-        return control1, control2
+        return np.array((
+            (start[0] + dx * t1 + perp_x * offset1, start[1] + dy * t1 + perp_y * offset1),
+            (start[0] + dx * t2 + perp_x * offset2, start[1] + dy * t2 + perp_y * offset2),
+        ))
 
     def _generate_multi_control_points(
-        self, start: Point, end: Point, num_controls: int = 3
-    ) -> list[Point]:
+        self,
+        start: np.ndarray,
+        end: np.ndarray,
+        dx: float,
+        dy: float,
+        distance: float,
+        num_controls: int = 3,
+    ) -> np.ndarray:
         """Generate 3-4 control points for more complex curves.
 
         Creates more organic, human-like paths by using higher-order
@@ -299,27 +583,44 @@ class BezierMovement:
         Args:
             start: Starting point
             end: Ending point
+            dx: end - start along x
+            dy: end - start along y
+            distance: Length of (dx, dy)
             num_controls: Number of control points (3 or 4)
 
         Returns:
-            List of control points
+            (num_controls, 2) array of control points
         """
-        dx = end.x - start.x
-        dy = end.y - start.y
-        distance = math.sqrt(dx * dx + dy * dy)
 
         if distance < 1:
-            return [start, end]
+            return np.stack((start, end))
 
-        # Perpendicular direction
-        perp_x = -dy / distance
-        perp_y = dx / distance
+        # Perpendicular direction (one reciprocal, two multiplies)
+        inv_distance = 1.0 / distance
+        perp_x = -dy * inv_distance
+        perp_y = dx * inv_distance
 
-        base_variance = self.config.curve_variance
-        if self.config.imperfection_enabled:
-            base_variance += gaussian_bounded(
-                self._rng, 0, self.config.control_point_variance
-            )
+        # Intentionally irregular t-value ranges (Gaussian for natural clustering)
+        if num_controls == 3:
+            # Three control points at irregular intervals
+            t_ranges = ((0.18, 0.32), (0.42, 0.58), (0.68, 0.82))
+        else:  # 4 control points
+            t_ranges = ((0.12, 0.25), (0.32, 0.45), (0.55, 0.68), (0.75, 0.88))
+
+        # One batched Gaussian draw: extra variance, t-values, then a
+        # magnitude scale per control; one uniform roll per control for sides
+        extra_variance = (
+            self.config.control_point_variance if self.config.imperfection_enabled else 0.0
+        )
+        draws = gaussian_bounded_batch(
+            self._rng,
+            ((0.0, extra_variance), *t_ranges) + ((0.3, 1.0),) * num_controls,
+        )
+        side_rolls = self._rng.random(num_controls).tolist()
+        t_values = draws[1:num_controls + 1]
+        magnitude_scales = draws[num_controls + 1:]
+
+        base_variance = self.config.curve_variance + draws[0]
 
         # Scale down variance for longer movements (same as standard control points)
         if distance > 100:
@@ -330,152 +631,168 @@ class BezierMovement:
         base_variance *= 0.7
 
         max_offset = distance * base_variance
-        controls = []
-
-        # Generate t-values that are intentionally irregular (Gaussian for natural clustering)
-        if num_controls == 3:
-            # Three control points at irregular intervals
-            t_values = [
-                gaussian_bounded(self._rng, 0.18, 0.32),
-                gaussian_bounded(self._rng, 0.42, 0.58),
-                gaussian_bounded(self._rng, 0.68, 0.82),
-            ]
-        else:  # 4 control points
-            t_values = [
-                gaussian_bounded(self._rng, 0.12, 0.25),
-                gaussian_bounded(self._rng, 0.32, 0.45),
-                gaussian_bounded(self._rng, 0.55, 0.68),
-                gaussian_bounded(self._rng, 0.75, 0.88),
-            ]
+        offsets = [0.0] * num_controls
 
         # Generate offsets with varying magnitudes (Gaussian for natural clusters)
         prev_offset = 0
-        for i, t in enumerate(t_values):
+        for i in range(num_controls):
             # Vary magnitude for each control point
-            magnitude = gaussian_bounded(self._rng, 0.3, 1.0) * max_offset
+            magnitude = magnitude_scales[i] * max_offset
 
             # Alternate sides with some randomness
             if i == 0:
-                offset = magnitude * (1 if self._rng.random() < 0.5 else -1)
+                offset = magnitude * (1 if side_rolls[i] < 0.5 else -1)
             else:
                 # 70% chance to be on opposite side from previous
-                if self._rng.random() < 0.7:
+                if side_rolls[i] < 0.7:
                     offset = -magnitude if prev_offset > 0 else magnitude
                 else:
                     offset = magnitude if prev_offset > 0 else -magnitude
 
             prev_offset = offset
+            offsets[i] = offset
 
-            control = Point(
-                start.x + dx * t + perp_x * offset,
-                start.y + dy * t + perp_y * offset,
-            )
-            controls.append(control)
-
-        return controls
-
-    def _calculate_overshoot(self, target: Point, dx: float, dy: float) -> Point:
-        """Calculate overshoot point past target."""
-        distance = math.sqrt(dx * dx + dy * dy)
-        if distance < 1:
-            return target
-
-        # Normalize direction
-        dir_x = dx / distance
-        dir_y = dy / distance
-
-        # Random overshoot distance (Gaussian for natural variance)
-        overshoot_dist = gaussian_bounded(
-            self._rng,
-            self.config.overshoot_distance[0],
-            self.config.overshoot_distance[1],
+        # Place all controls at once: start + t * (dx, dy) + offset * perp
+        return (
+            start
+            + np.outer(t_values, (dx, dy))
+            + np.outer(offsets, (perp_x, perp_y))
         )
 
-        # Add some perpendicular drift (Gaussian)
-        perp_drift = gaussian_bounded(self._rng, -5, 5)
+    def _calculate_overshoot(
+        self, target: np.ndarray, dir_x: float, dir_y: float
+    ) -> np.ndarray:
+        """Calculate overshoot point past target.
 
-        return Point(
-            target.x + dir_x * overshoot_dist - dir_y * perp_drift,
-            target.y + dir_y * overshoot_dist + dir_x * perp_drift,
+        Args:
+            target: Point being moved to
+            dir_x: Normalized movement direction x
+            dir_y: Normalized movement direction y
+        """
+        # Random overshoot distance plus some perpendicular drift, drawn in
+        # one batch (Gaussian for natural variance)
+        overshoot_dist, perp_drift = gaussian_bounded_batch(
+            self._rng, (self.config.overshoot_distance, (-5, 5))
         )
 
+        return np.array((
+            target[0] + dir_x * overshoot_dist - dir_y * perp_drift,
+            target[1] + dir_y * overshoot_dist + dir_x * perp_drift,
+        ))
+
     def _bezier_curve(
         self,
-        p0: Point,
-        p1: Point,
-        p2: Point,
-        p3: Point,
+        p0: np.ndarray,
+        p1: np.ndarray,
+        p2: np.ndarray,
+        p3: np.ndarray,
         num_points: int,
         easing_func: Optional[callable] = None,
-    ) -> list[Point]:
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """Generate points along a cubic Bezier curve.
 
         Points are distributed uniformly along the curve parameter.
         Easing is NOT applied here - it's applied to timing in get_point_delays().
         This prevents point clustering that causes teleporting.
+
+        Args:
+            out: Optional (num_points, 2) float64 array (or slice) to write into
+
+        Returns:
+            (num_points, 2) array of path points (out, if given)
+
+        Raises:
+            ValueError: If out is not a (num_points, 2) array
         """
         # Note: easing_func parameter is kept for API compatibility but ignored
         # Easing is now applied to timing, not point distribution
-        points = []
-
-        for i in range(num_points):
-            # Use linear t for uniform point distribution
-            t = i / (num_points - 1) if num_points > 1 else 1
-
-            # Cubic Bezier formula
-            x = (
-                (1 - t) ** 3 * p0.x
-                + 3 * (1 - t) ** 2 * t * p1.x
-                + 3 * (1 - t) * t ** 2 * p2.x
-                + t ** 3 * p3.x
+        if out is None:
+            out = np.empty((num_points, 2))
+        elif out.shape != (num_points, 2):
+            # The JIT kernel writes unchecked, so a mismatch must not reach it
+            raise ValueError(
+                f"out must have shape ({num_points}, 2), got {out.shape}"
             )
-            y = (
-                (1 - t) ** 3 * p0.y
-                + 3 * (1 - t) ** 2 * t * p1.y
-                + 3 * (1 - t) * t ** 2 * p2.y
-                + t ** 3 * p3.y
+
+        if NUMBA_AVAILABLE:
+            # JIT-compiled kernel writes straight into the output array
+            _bezier_cubic_into(
+                out, _uniform_t(num_points),
+                float(p0[0]), float(p0[1]), float(p1[0]), float(p1[1]),
+                float(p2[0]), float(p2[1]), float(p3[0]), float(p3[1]),
             )
+            return out
 
-            points.append(Point(x, y))
+        # Cached Bernstein basis: the curve is one matrix product
+        return np.matmul(_cubic_basis(num_points), np.stack((p0, p1, p2, p3)), out=out)
 
-        return points
+    def _bezier_segments(self, controls: np.ndarray, num_points: int) -> np.ndarray:
+        """Evaluate several cubic Bezier segments of equal length at once.
+
+        Args:
+            controls: (S, 4, 2) array of control points, one p0..p3 block per segment
+            num_points: Points per segment
+
+        Returns:
+            (S, num_points, 2) array of segment points
+        """
+        # Cached basis broadcast over the segments: one batched product
+        return _cubic_basis(num_points) @ controls
 
     def _generate_quadratic_curve(
         self,
-        p0: Point,
-        p1: Point,
-        p2: Point,
+        p0: np.ndarray,
+        p1: np.ndarray,
+        p2: np.ndarray,
         num_points: int,
         easing_func: Optional[callable] = None,
-    ) -> list[Point]:
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
         """Generate points along a quadratic Bezier curve.
 
         Points are distributed uniformly along the curve parameter.
         Easing is NOT applied here - it's applied to timing in get_point_delays().
-        """
-        # Note: easing_func parameter is kept for API compatibility but ignored
-        points = []
 
-        for i in range(num_points):
-            # Use linear t for uniform point distribution
-            t = i / (num_points - 1) if num_points > 1 else 1
+        Args:
+            out: Optional (num_points, 2) float64 array (or slice) to write into
+
+        Returns:
+            (num_points, 2) array of path points (out, if given)
 
-            # Quadratic Bezier formula
-            x = (1 - t) ** 2 * p0.x + 2 * (1 - t) * t * p1.x + t ** 2 * p2.x
-            y = (1 - t) ** 2 * p0.y + 2 * (1 - t) * t * p1.y + t ** 2 * p2.y
+        Raises:
+            ValueError: If out is not a (num_points, 2) array
+        """
+        # Note: easing_func parameter is kept for API compatibility but ignored
+        if out is None:
+            out = np.empty((num_points, 2))
+        elif out.shape != (num_points, 2):
+            # The JIT kernel writes unchecked, so a mismatch must not reach it
+            raise ValueError(
+                f"out must have shape ({num_points}, 2), got {out.shape}"
+            )
 
-            points.append(Point(x, y))
+        if NUMBA_AVAILABLE:
+            # JIT-compiled kernel writes straight into the output array
+            _bezier_quadratic_into(
+                out, _uniform_t(num_points),
+                float(p0[0]), float(p0[1]), float(p1[0]), float(p1[1]),
+                float(p2[0]), float(p2[1]),
+            )
+            return out
 
-        return points
+        # Cached Bernstein basis: the curve is one matrix product
+        return np.matmul(_quadratic_basis(num_points), np.stack((p0, p1, p2)), out=out)
 
     def _generate_multi_segment_curve(
         self,
-        start: Point,
-        end: Point,
-        controls: list[Point],
+        start: np.ndarray,
+        end: np.ndarray,
+        controls: np.ndarray,
         num_points: int,
         easing_func: Optional[callable] = None,
-    ) -> list[Point]:
+        distance: Optional[float] = None,
+    ) -> np.ndarray:
         """Generate a curve through multiple control points using chained cubic segments.
 
         Instead of a single high-order Bezier, chains multiple cubic segments
@@ -484,93 +801,90 @@ class BezierMovement:
         Args:
             start: Starting point
             end: Ending point
-            controls: List of 3-4 control points
+            controls: (3-4, 2) array of control points
             num_points: Total points in output path
             easing_func: Optional easing function
+            distance: Precomputed start-end distance, if the caller has it
 
         Returns:
-            List of points forming the path
+            (num_points, 2) array of points forming the path (a view of the
+            scratch path buffer, valid until the next path is generated)
         """
         if easing_func is None:
-            # Calculate distance for organic easing
-            dx = end.x - start.x
-            dy = end.y - start.y
-            distance = math.sqrt(dx * dx + dy * dy)
+            # Calculate distance for organic easing (unless already known)
+            if distance is None:
+                _, _, distance = self._offset(start, end)
             easing_func = self._get_random_easing_function(distance)
 
-        if len(controls) < 2:
-            # Fall back to standard cubic
-            c1, c2 = self._generate_control_points(start, end)
+        if len(controls) < 2 or num_points < 2 * (len(controls) + 1):
+            # Fall back to standard cubic (also when there are too few points
+            # to give every segment both of its end points)
+            c1, c2 = self._generate_control_points(start, end, *self._offset(start, end))
             return self._bezier_curve(start, c1, c2, end, num_points, easing_func)
 
         # Create waypoints: start -> controls -> end
-        waypoints = [start] + controls + [end]
+        waypoints = np.vstack((start, controls, end))
 
         # Generate smooth path through waypoints using Catmull-Rom style interpolation
         # We'll create cubic Bezier segments between each pair of waypoints
-        all_points = []
         num_segments = len(waypoints) - 1
         points_per_segment = num_points // num_segments
 
-        for i in range(num_segments):
-            p0 = waypoints[i]
-            p3 = waypoints[i + 1]
-
-            # Calculate control points for this segment based on neighboring waypoints
-            # This creates smooth transitions between segments
-            if i == 0:
-                # First segment: use direction toward next waypoint
-                dx = waypoints[i + 1].x - p0.x
-                dy = waypoints[i + 1].y - p0.y
-                p1 = Point(p0.x + dx * 0.33, p0.y + dy * 0.33)
-            else:
-                # Use tangent from previous waypoint
-                prev = waypoints[i - 1]
-                dx = p3.x - prev.x
-                dy = p3.y - prev.y
-                p1 = Point(p0.x + dx * 0.15, p0.y + dy * 0.15)
-
-            if i == num_segments - 1:
-                # Last segment: use direction from previous waypoint
-                dx = p3.x - waypoints[i].x
-                dy = p3.y - waypoints[i].y
-                p2 = Point(p3.x - dx * 0.33, p3.y - dy * 0.33)
-            else:
-                # Use tangent toward next waypoint
-                next_wp = waypoints[i + 2]
-                dx = next_wp.x - p0.x
-                dy = next_wp.y - p0.y
-                p2 = Point(p3.x - dx * 0.15, p3.y - dy * 0.15)
-
-            # Add some randomness to control points (Gaussian for natural variance)
-            variance = 0.1
-            p1 = Point(
-                p1.x + gaussian_bounded(self._rng, -variance, variance) * abs(p3.x - p0.x),
-                p1.y + gaussian_bounded(self._rng, -variance, variance) * abs(p3.y - p0.y),
-            )
-            p2 = Point(
-                p2.x + gaussian_bounded(self._rng, -variance, variance) * abs(p3.x - p0.x),
-                p2.y + gaussian_bounded(self._rng, -variance, variance) * abs(p3.y - p0.y),
-            )
-
-            # Generate this segment
-            segment_points = points_per_segment if i < num_segments - 1 else num_points - len(all_points)
-            segment = self._bezier_curve(p0, p1, p2, p3, segment_points, easing_func)
+        # Every segment but the last has points_per_segment points; the last
+        # takes the remainder. Neighbouring segments share their boundary
+        # point, so each segment contributes all but its end point
+        head_points = (num_segments - 1) * (points_per_segment - 1)
+        last_points = num_points - points_per_segment - (num_segments - 2) * (points_per_segment - 1)
+        path = self._path_buffer(head_points + last_points)
+
+        # Randomness for every segment's inner control points, drawn in one
+        # batch (Gaussian for natural variance): [segment, p1/p2, x/y]
+        variance = 0.1
+        control_noise = np.array(gaussian_bounded_batch(
+            self._rng, ((-variance, variance),) * (4 * num_segments)
+        )).reshape(num_segments, 2, 2)
+
+        # Control points for every segment at once, based on neighboring
+        # waypoints. This creates smooth transitions between segments
+        p0 = waypoints[:-1]
+        p3 = waypoints[1:]
+
+        # Inner segments use the tangent from the previous waypoint; the first
+        # segment uses the direction toward the next waypoint instead
+        p1 = np.empty_like(p0)
+        p1[0] = p0[0] + (p3[0] - p0[0]) * 0.33
+        p1[1:] = p0[1:] + (p3[1:] - waypoints[:-2]) * 0.15
+
+        # Inner segments use the tangent toward the next waypoint; the last
+        # segment uses the direction from the previous waypoint instead
+        p2 = np.empty_like(p3)
+        p2[:-1] = p3[:-1] - (waypoints[2:] - p0[:-1]) * 0.15
+        p2[-1] = p3[-1] - (p3[-1] - p0[-1]) * 0.33
+
+        # Add some randomness to control points, scaled by each segment's span
+        span = np.abs(p3 - p0)
+        p1 += control_noise[:, 0] * span
+        p2 += control_noise[:, 1] * span
+
+        # Evaluate the equal-length segments in one batched product, then the
+        # remainder segment, which starts on the previous segment's end point
+        controls = np.stack((p0, p1, p2, p3), axis=1)
+        head = self._bezier_segments(controls[:-1], points_per_segment)
+        path[:head_points] = head[:, :-1].reshape(-1, 2)
+        self._bezier_curve(
+            *controls[-1], last_points, easing_func, out=path[head_points:]
+        )
 
-            # Avoid duplicate points at segment boundaries
-            if all_points:
-                all_points.extend(segment[1:])
-            else:
-                all_points.extend(segment)
+        return path
 
-        return all_points
+    # Legacy easing functions accept a scalar t or a NumPy array of t values
 
     def _ease_in_out(self, t: float) -> float:
-        """Ease-in-out function for natural acceleration/deceleration."""
-        if t < 0.5:
-            return 2 * t * t
-        else:
-            return 1 - (-2 * t + 2) ** 2 / 2
+        """Ease-in-out function for natural acceleration/deceleration.
+
+        Smoothstep polynomial: branch-free, so it works unchanged on arrays.
+        """
+        return t * t * (3.0 - 2.0 * t)
 
     def _ease_in(self, t: float) -> float:
         """Ease-in function (slow start, fast end)."""
@@ -584,12 +898,26 @@ class BezierMovement:
         """Linear easing (constant speed)."""
         return t
 
-    def _ease_in_out_back(self, t: float) -> float:
-        """Ease-in-out with slight anticipation/overshoot effect."""
-        c1, c2 = 1.70158, 1.70158 * 1.525
-        if t < 0.5:
-            return (2 * t) ** 2 * ((c2 + 1) * 2 * t - c2) / 2
-        return ((2 * t - 2) ** 2 * ((c2 + 1) * (t * 2 - 2) + c2) + 2) / 2
+    def _ease_in_out_back(
+        self, t: Union[float, np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """Ease-in-out with slight anticipation/overshoot effect.
+
+        Returns a float for a scalar t, or an array for an array of t values.
+        """
+        # Horner form on shared subexpressions u = 2t and v = 2t - 2
+        u = 2.0 * t
+        if not isinstance(t, np.ndarray):
+            # Scalar t: plain float branch, no array round-trip
+            if t < 0.5:
+                return u * u * (_EASE_BACK_A * u - _EASE_BACK_C2) * 0.5
+            v = u - 2.0
+            return (v * v * (_EASE_BACK_A * v + _EASE_BACK_C2) + 2.0) * 0.5
+
+        v = u - 2.0
+        rising = u * u * (_EASE_BACK_A * u - _EASE_BACK_C2) * 0.5
+        falling = (v * v * (_EASE_BACK_A * v + _EASE_BACK_C2) + 2.0) * 0.5
+        return np.where(t < 0.5, rising, falling)
 
     def _get_random_easing_function(self, distance: float = 100) -> callable:
         """Get a unique organic easing function for this movement.
@@ -612,25 +940,43 @@ class BezierMovement:
         if not self.config.speed_variation_enabled:
             return self._ease_in_out
 
+        # Rebuild the sampler only when the configured easings change
+        key = (tuple(self.config.easing_functions), tuple(self.config.easing_weights))
+        if key != self._easing_key:
+            self._build_easing_sampler(*key)
+
+        # Cumulative-weight pick in a single C-level call
+        return self._py_random.choices(
+            self._easing_fns, cum_weights=self._easing_cum, k=1
+        )[0]
+
+    def _build_easing_sampler(
+        self, functions: tuple[str, ...], weights: tuple[float, ...]
+    ) -> None:
+        """Cache easing callables and their normalized cumulative weights.
+
+        Args:
+            functions: Easing function names from config
+            weights: Relative weight for each name
+        """
         easing_map = {
             "ease_in_out": self._ease_in_out,
             "ease_in": self._ease_in,
             "ease_out": self._ease_out,
+            "linear": self._linear,
             "ease_in_out_back": self._ease_in_out_back,
         }
+        self._easing_fns = [easing_map.get(name, self._ease_in_out) for name in functions]
 
-        functions = list(self.config.easing_functions)
-        weights = list(self.config.easing_weights)
-
-        # Normalize weights
+        # Normalize weights; a zero total falls back to the last easing
         total = sum(weights)
         if total > 0:
-            weights = [w / total for w in weights]
-
-        choice = self._rng.choice(functions, p=weights)
-        return easing_map.get(choice, self._ease_in_out)
+            self._easing_cum = list(itertools.accumulate(w / total for w in weights))
+        else:
+            self._easing_cum = [0.0] * (len(weights) - 1) + [1.0]
+        self._easing_key = (functions, weights)
 
-    def add_micro_corrections(self, path: list[Point], end_point: Point) -> list[Point]:
+    def add_micro_corrections(self, path: np.ndarray, end_point: np.ndarray) -> np.ndarray:
         """Add small mid-path deviations to simulate natural hand adjustments.
 
         Inserts 1-2 small corrections (2-8 pixels) in the middle portion of the path.
@@ -645,42 +991,34 @@ class BezierMovement:
         start_idx = len(path) // 5
         end_idx = len(path) * 4 // 5
 
-        # Insert 1-2 corrections
-        num_corrections = self._rng.integers(1, 3)
-        correction_indices = sorted(
-            self._rng.choice(range(start_idx, end_idx), size=min(num_corrections, end_idx - start_idx), replace=False)
+        # Insert 1-2 corrections at distinct indices (a permutation prefix is
+        # a sample without replacement, minus choice()'s generic dispatch)
+        num_corrections = min(self._py_random.randrange(1, 3), end_idx - start_idx)
+        correction_indices = (
+            self._rng.permutation(end_idx - start_idx)[:num_corrections] + start_idx
         )
 
-        result = list(path)
-        for idx in correction_indices:
-            if idx >= len(result):
-                continue
-
-            # Random deviation magnitude (Gaussian for natural distribution)
-            magnitude = gaussian_bounded(
-                self._rng,
-                self.config.micro_correction_magnitude[0],
-                self.config.micro_correction_magnitude[1],
-            )
+        # Random deviation magnitudes (Gaussian for natural distribution) and
+        # angles, each drawn in one batch
+        magnitudes = gaussian_bounded_batch(
+            self._rng, (self.config.micro_correction_magnitude,) * num_corrections
+        )
+        angles = self._rng.uniform(0, 2 * math.pi, size=num_corrections).tolist()
 
-            # Random angle for deviation
-            angle = self._rng.uniform(0, 2 * math.pi)
+        # Apply each deviation with plain float math: for 1-2 corrections this
+        # is cheaper than building a deviation array and fancy-indexing it
+        result = path.copy()
+        for idx, magnitude, angle in zip(correction_indices.tolist(), magnitudes, angles):
             dx = magnitude * math.cos(angle)
             dy = magnitude * math.sin(angle)
-
-            # Apply deviation
-            result[idx] = Point(result[idx].x + dx, result[idx].y + dy)
-
-            # Add correction back toward path on next point (if exists)
-            if idx + 1 < len(result):
-                result[idx + 1] = Point(
-                    result[idx + 1].x - dx * 0.5,
-                    result[idx + 1].y - dy * 0.5
-                )
+            result[idx] += (dx, dy)
+            # Correct back toward the path on the next point (end_idx stops at
+            # 80% of the path, so idx + 1 always exists)
+            result[idx + 1] -= (dx * 0.5, dy * 0.5)
 
         return result
 
-    def add_jitter_to_path(self, path: list[Point], target_point: Point) -> list[Point]:
+    def add_jitter_to_path(self, path: np.ndarray, target_point: np.ndarray) -> np.ndarray:
         """Add small oscillations near the end of the path to simulate hand tremor.
 
         Adds small jitter (1-3 pixels) to the last 10-20% of the path.
@@ -692,7 +1030,7 @@ class BezierMovement:
         if len(path) < 5:
             return path
 
-        result = list(path)
+        result = path.copy()
 
         # Apply jitter to last 15% of path
         jitter_start = int(len(path) * 0.85)
@@ -701,37 +1039,40 @@ class BezierMovement:
         if num_jitter_points <= 0:
             return result
 
-        # Distribute jitter points in the final portion
-        jitter_indices = np.linspace(jitter_start, len(path) - 2, num_jitter_points, dtype=int)
+        # Distribute jitter points evenly over the final portion (integer
+        # equivalent of a truncated linspace from jitter_start to len - 2)
+        span = len(path) - 2 - jitter_start
+        steps = max(1, num_jitter_points - 1)
+        jitter_indices = [jitter_start + i * span // steps for i in range(num_jitter_points)]
 
-        for i, idx in enumerate(jitter_indices):
-            if idx >= len(result) - 1:
-                continue
+        # One batched draw for every jitter radius (Gaussian for natural distribution)
+        radii = gaussian_bounded_batch(
+            self._rng, (self.config.jitter_radius,) * num_jitter_points
+        )
 
-            # Oscillate with decreasing magnitude toward end
-            decay = 1.0 - (i / num_jitter_points) * 0.5  # Reduce jitter as we approach target
-            radius = gaussian_bounded(
-                self._rng,
-                self.config.jitter_radius[0],
-                self.config.jitter_radius[1],
-            ) * decay
-
-            # Alternate sides for oscillation effect
-            angle = (math.pi / 2) if i % 2 == 0 else (-math.pi / 2)
-
-            # Get direction perpendicular to path
-            if idx + 1 < len(result):
-                dx = result[idx + 1].x - result[idx].x
-                dy = result[idx + 1].y - result[idx].y
-                length = math.sqrt(dx * dx + dy * dy)
+        # Oscillate with decreasing magnitude toward end, alternating sides
+        scales = [
+            radius
+            * (1.0 - (i / num_jitter_points) * 0.5)  # Reduce jitter as we approach target
+            * (1 if i % 2 == 0 else -1)
+            for i, radius in enumerate(radii)
+        ]
+
+        if NUMBA_AVAILABLE:
+            # JIT-compiled kernel offsets the rows in place
+            _jitter_into(result, np.array(jitter_indices), np.array(scales))
+        else:
+            # Per-point math on plain floats: with only a few jitter points this
+            # beats array ops, whose fixed per-call overhead dominates at this size
+            for idx, scale in zip(jitter_indices, scales):
+                # Offset perpendicular to the path's next segment
+                (x0, y0), (x1, y1) = result[idx:idx + 2].tolist()
+                dx = x1 - x0
+                dy = y1 - y0
+                length = math.hypot(dx, dy)
                 if length > 0:
-                    # Perpendicular offset
-                    perp_x = -dy / length
-                    perp_y = dx / length
-                    result[idx] = Point(
-                        result[idx].x + perp_x * radius * (1 if i % 2 == 0 else -1),
-                        result[idx].y + perp_y * radius * (1 if i % 2 == 0 else -1)
-                    )
+                    scale /= length
+                    result[idx] = (x0 - dy * scale, y0 + dx * scale)
 
         # Ensure final point stays close to target
         if len(result) > 0:
@@ -740,35 +1081,48 @@ class BezierMovement:
         return result
 
     def calculate_movement_time(
-        self, start: tuple[int, int], end: tuple[int, int]
+        self,
+        start: tuple[int, int],
+        end: tuple[int, int],
+        distance: Optional[float] = None,
     ) -> float:
         """Calculate movement time based on distance and speed.
 
         Args:
             start: Starting coordinates
             end: Target coordinates
+            distance: Precomputed start-end distance, if the caller has it
 
         Returns:
             Movement time in seconds
         """
-        dx = end[0] - start[0]
-        dy = end[1] - start[1]
-        distance = math.sqrt(dx * dx + dy * dy)
+        # Add some minimum time for very short distances
+        min_time = 0.05
+
+        # Even the slowest speed covers this distance within min_time, so up
+        # to it the speed draw could not change the result
+        min_speed, max_speed = self.config.speed_range
+        min_time_distance = min_time * min_speed
+
+        if distance is None:
+            dx = end[0] - start[0]
+            dy = end[1] - start[1]
+            # Squared comparison: short moves never need the square root
+            if dx * dx + dy * dy <= min_time_distance * min_time_distance:
+                return min_time
+            distance = math.hypot(dx, dy)
+
+        if distance <= min_time_distance:
+            return min_time
 
         # Random speed within range (Gaussian for natural variance)
-        speed = gaussian_bounded(
-            self._rng,
-            self.config.speed_range[0],
-            self.config.speed_range[1],
-        )
+        speed = gaussian_bounded(self._rng, min_speed, max_speed)
 
-        # Add some minimum time for very short distances
-        min_time = 0.05
         return max(min_time, distance / speed)
 
     def get_point_delays(
         self,
-        path: list[tuple[int, int]],
+        path: Union[list[tuple[int, int]], np.ndarray],
         total_time: float,
         target_width: float = 10.0,
     ) -> list[float]:
@@ -785,23 +1139,23 @@ class BezierMovement:
         5. Fitts's Law deceleration (target-aware slowdown in final approach)
 
         Args:
-            path: List of path points
+            path: Path points, as (x, y) tuples or an (N, 2) array
             total_time: Total movement time in seconds
             target_width: Width of target area for Fitts's Law deceleration
 
         Returns:
             List of delays between consecutive points
         """
+        cfg = self.config
         if len(path) < 2:
             return []
 
         num_segments = len(path) - 1
-        delays = []
 
         # Determine if we add a micro-pause this movement
         add_micro_pause = (
-            self.config.speed_variation_enabled
-            and self._rng.random() < self.config.micro_pause_chance
+            cfg.speed_variation_enabled
+            and self._py_random.random() < cfg.micro_pause_chance
         )
         micro_pause_index = -1
         micro_pause_duration = 0.0
@@ -810,71 +1164,71 @@ class BezierMovement:
             # Place pause in middle 60% of path
             start_range = int(num_segments * 0.2)
             end_range = int(num_segments * 0.8)
-            micro_pause_index = self._rng.integers(start_range, end_range)
+            micro_pause_index = self._py_random.randrange(start_range, end_range)
             micro_pause_duration = gaussian_bounded(
                 self._rng,
-                self.config.micro_pause_duration[0],
-                self.config.micro_pause_duration[1],
+                cfg.micro_pause_duration[0],
+                cfg.micro_pause_duration[1],
             )
 
         # Calculate distances between consecutive points
         # This handles natural curve geometry variations (curves bend more in some places)
-        distances = []
-        for i in range(num_segments):
-            dx = path[i + 1][0] - path[i][0]
-            dy = path[i + 1][1] - path[i][1]
-            distances.append(math.sqrt(dx * dx + dy * dy))
+        if isinstance(path, np.ndarray):
+            steps = np.diff(path, axis=0).astype(np.float64)
+            distances = np.hypot(steps[:, 0], steps[:, 1])
+        else:
+            # Tuple paths: math.dist over neighbouring pairs is cheaper than
+            # converting the list to an array first
+            distances = np.fromiter(
+                map(math.dist, path, itertools.islice(path, 1, None)),
+                dtype=np.float64,
+                count=num_segments,
+            )
 
-        total_distance = sum(distances)
+        total_distance = float(distances.sum())
 
         # Generate the continuous speed profile (creates slow-fast-slow pattern)
         speed_factors = self._generate_speed_profile(num_segments)
 
-        for i in range(num_segments):
-            # Base delay proportional to distance (handles curve geometry)
-            if total_distance > 0:
-                proportion = distances[i] / total_distance
-                base_delay = total_time * proportion
-            else:
-                base_delay = total_time / num_segments
-
-            # Apply speed profile for natural acceleration/deceleration
-            delay = base_delay / speed_factors[i]
+        # Base delay proportional to distance (handles curve geometry). From
+        # here on every step updates this one array in place
+        if total_distance > 0:
+            delays = distances * (total_time / total_distance)
+        else:
+            delays = np.full(num_segments, total_time / num_segments)
 
-            # Add micro-pause at designated point
-            if i == micro_pause_index:
-                delay += micro_pause_duration
+        # Apply speed profile for natural acceleration/deceleration
+        delays /= speed_factors
 
-            delays.append(delay)
+        # Add micro-pause at designated point
+        if micro_pause_index >= 0:
+            delays[micro_pause_index] += micro_pause_duration
 
         # Apply Fitts's Law deceleration in final approach
-        if self.config.fitts_enabled and total_distance > 0:
-            delays = self._apply_fitts_deceleration(
-                delays, total_distance, target_width
-            )
+        if cfg.fitts_enabled and total_distance > 0:
+            delays = self._apply_fitts_deceleration(delays, total_distance, target_width)
 
         # Normalize to match total time (including micro-pause)
         target_time = total_time + micro_pause_duration
-        total_delays = sum(delays)
+        total_delays = delays.sum()
         if total_delays > 0:
-            scale = target_time / total_delays
-            delays = [d * scale for d in delays]
+            delays *= target_time / total_delays
 
-        return delays
+        return delays.tolist()
 
     def _apply_fitts_deceleration(
         self,
-        delays: list[float],
+        delays: np.ndarray,
         distance: float,
         target_width: float,
-    ) -> list[float]:
+    ) -> np.ndarray:
         """Apply Fitts's Law deceleration to delays in final approach.
 
         Fitts's Law: MT = a + b * log2(D/W + 1)
         Smaller targets require more careful (slower) final approach.
 
         Args:
-            delays: Original delay list
+            delays: Original delays, one per segment
             distance: Total movement distance
             target_width: Width of target area
 
@@ -898,20 +1252,24 @@ class BezierMovement:
         # Normalize difficulty to a multiplier (1.0 to 2.0 range)
         decel_strength = 1.0 + min(1.0, index_of_difficulty / 5.0)
 
-        result = list(delays)
-        for i in range(decel_start_idx, num_segments):
-            # Calculate progress through deceleration phase
-            decel_progress = (i - decel_start_idx) / max(1, num_segments - decel_start_idx)
-
-            # Exponential deceleration (slower and slower)
-            # Higher decel_strength = more pronounced slowdown
-            decel_factor = 1.0 + (decel_strength - 1.0) * (decel_progress ** 1.5)
+        # Progress through the deceleration phase for every remaining segment
+        decel_progress = np.arange(num_segments - decel_start_idx) / max(
+            1, num_segments - decel_start_idx
+        )
 
-            result[i] *= decel_factor
+        # Exponential deceleration (slower and slower)
+        # Higher decel_strength = more pronounced slowdown; p * sqrt(p)
+        # is p ** 1.5 without the generic float power
+        result = delays.copy()
+        result[decel_start_idx:] *= 1.0 + (decel_strength - 1.0) * (
+            decel_progress * np.sqrt(decel_progress)
+        )
 
         return result
 
-    def _generate_speed_profile(self, num_segments: int, movement_distance: float = 100) -> list[float]:
+    def _generate_speed_profile(
+        self, num_segments: int, movement_distance: float = 100
+    ) -> np.ndarray:
         """Generate a continuous speed profile with gradual variations.
 
         Creates organic speed changes that:
@@ -926,31 +1284,27 @@ class BezierMovement:
             movement_distance: Distance in pixels (affects organic curve)
 
         Returns:
-            List of speed factors (higher = faster movement)
+            Array of speed factors (higher = faster movement)
         """
-        min_factor = self.config.min_speed_factor
-        max_factor = self.config.max_speed_factor
+        cfg = self.config
+        min_factor = cfg.min_speed_factor
+        max_factor = cfg.max_speed_factor
         factor_range = max_factor - min_factor
 
         # Use organic easing for base curve if enabled
-        use_organic = self.config.organic_easing_config.enabled
+        use_organic = cfg.organic_easing_config.enabled
 
-        if not self.config.speed_variation_enabled:
+        if not cfg.speed_variation_enabled:
             if use_organic:
                 # Use organic base even without variation
                 organic_profile = self._organic_easing.generate_base_profile(
                     num_segments, movement_distance
                 )
-                return [
-                    min_factor + factor_range * base
-                    for base in organic_profile
-                ]
+                return min_factor + factor_range * organic_profile
             else:
                 # Legacy: basic ease-in-out with sin()
-                return [
-                    min_factor + factor_range * math.sin(i / num_segments * math.pi)
-                    for i in range(num_segments)
-                ]
+                _, sin_progress = _progress_table(num_segments)
+                return min_factor + factor_range * sin_progress
 
         # Generate organic parameters for this movement's speed profile
         if use_organic:
@@ -960,64 +1314,77 @@ class BezierMovement:
             asymmetry = profile_params['asymmetry']
         else:
             # Legacy: fixed asymmetry range
-            asymmetry = self._rng.uniform(-0.15, 0.15)
+            asymmetry = self._py_random.uniform(-0.15, 0.15)
 
         # Secondary waves: medium frequency oscillations (2-4 cycles)
         # These add variation on top of the base curve (Gaussian for natural clustering)
-        num_waves = self._rng.integers(2, 5)
-        wave_amplitudes = [gaussian_bounded(self._rng, 0.08, 0.20) for _ in range(num_waves)]
-        wave_phases = [gaussian_bounded(self._rng, 0, 2 * math.pi) for _ in range(num_waves)]
-        wave_frequencies = [gaussian_bounded(self._rng, 1.5, 4.0) for _ in range(num_waves)]
+        # Wave amplitudes, phases and frequencies plus the drift strength below
+        # come from one batched draw
+        num_waves = self._py_random.randrange(2, 5)
+        draws = gaussian_bounded_batch(
+            self._rng,
+            ((0.08, 0.20),) * num_waves
+            + ((0, 2 * math.pi),) * num_waves
+            + ((1.5, 4.0),) * num_waves
+            + ((0.0, 0.15),),
+        )
+        wave_amplitudes, wave_phases, wave_frequencies = np.array(
+            draws[:-1], dtype=np.float32
+        ).reshape(3, num_waves)
 
         # Drift: gradual shift in overall speed (like hand fatigue/recovery)
-        drift_direction = self._rng.choice([-1, 1])
-        drift_strength = gaussian_bounded(self._rng, 0.0, 0.15)
+        drift_direction = 1 if self._py_random.random() < 0.5 else -1
+        drift_strength = draws[-1]
 
         # Generate smooth noise for micro-variation using cumulative random walk
         noise = self._generate_smooth_noise(num_segments, smoothness=0.85)
 
-        speed_factors = []
-
-        for i in range(num_segments):
-            progress = i / num_segments
+        # Every component is evaluated over the whole (cached) progress array at once
+        progress, sin_progress = _progress_table(num_segments)
 
-            # 1. Base curve: organic or legacy
-            if use_organic:
-                # Use organic base (no mathematical constants)
-                base = self._organic_easing.apply_organic_base(progress, profile_params)
-            else:
-                # Legacy: asymmetric slow-fast-slow using sin()
-                adjusted_progress = progress + asymmetry * math.sin(progress * math.pi)
-                adjusted_progress = max(0, min(1, adjusted_progress))
-                base = math.sin(adjusted_progress * math.pi)
-
-            # 2. Secondary waves: medium frequency oscillations
-            wave_sum = 0
-            for w in range(num_waves):
-                wave_sum += wave_amplitudes[w] * math.sin(
-                    wave_frequencies[w] * progress * math.pi + wave_phases[w]
-                )
-
-            # 3. Drift: gradual overall speed shift
-            drift = drift_direction * drift_strength * progress
+        # 1. Base curve: organic or legacy
+        if use_organic:
+            # Use organic base (no mathematical constants)
+            base = self._organic_easing.apply_organic_base_array(progress, profile_params)
+        else:
+            # Legacy: asymmetric slow-fast-slow using sin()
+            adjusted_progress = progress + asymmetry * sin_progress
+            base = np.sin(np.clip(adjusted_progress, 0, 1) * math.pi)
+
+        if NUMBA_AVAILABLE:
+            # JIT-compiled kernel fuses the remaining components, the clamp and
+            # the scaling into one pass without temporaries
+            speed_factors = np.empty(num_segments)
+            _speed_profile_into(
+                speed_factors, progress, base, wave_amplitudes, wave_frequencies,
+                wave_phases, drift_direction * drift_strength, noise,
+                min_factor, factor_range,
+            )
+            return speed_factors
 
-            # 4. Smooth noise: micro-variation
-            noise_contribution = noise[i] * 0.12
+        # 2. Secondary waves: medium frequency oscillations, one row per wave
+        waves = np.sin(
+            np.multiply.outer(wave_frequencies, progress * math.pi)
+            + wave_phases[:, np.newaxis]
+        )
+        wave_sum = wave_amplitudes @ waves
 
-            # Combine all components
-            combined = base + wave_sum + drift + noise_contribution
+        # 3. Drift: gradual overall speed shift
+        drift = (drift_direction * drift_strength) * progress
 
-            # Ensure we stay in valid range [0, 1] before scaling
-            combined = max(0.05, min(1.0, combined))
+        # 4. Smooth noise: micro-variation
+        noise_contribution = noise * 0.12
 
-            # Scale to actual speed factor range
-            speed_factor = min_factor + factor_range * combined
+        # Combine all components
+        combined = base + wave_sum + drift + noise_contribution
 
-            speed_factors.append(speed_factor)
+        # Ensure we stay in valid range [0, 1] before scaling
+        combined = np.clip(combined, 0.05, 1.0)
 
-        return speed_factors
+        # Scale to actual speed factor range
+        return min_factor + factor_range * combined
 
-    def _generate_smooth_noise(self, length: int, smoothness: float = 0.8) -> list[float]:
+    def _generate_smooth_noise(self, length: int, smoothness: float = 0.8) -> np.ndarray:
         """Generate smooth random noise using exponential moving average.
 
         Creates noise that varies gradually, not abruptly. Uses Gaussian
@@ -1028,15 +1395,22 @@ class BezierMovement:
             smoothness: How smooth (0 = random, 1 = very smooth)
 
         Returns:
-            List of noise values in range [-1, 1]
+            Array of noise values in range [-1, 1]
         """
-        noise = []
-        current = gaussian_bounded(self._rng, -1, 1)
-
-        for _ in range(length):
-            # Blend current value with new random value (Gaussian for natural distribution)
-            target = gaussian_bounded(self._rng, -1, 1)
-            current = smoothness * current + (1 - smoothness) * target
-            noise.append(current)
-
+        if length <= 0:
+            return np.zeros(0)
+
+        # Starting value plus one target per step in a single draw, each
+        # distributed like gaussian_bounded(-1, 1): std 1/3, clamped. The
+        # filtering runs in float32, like the rest of the speed profile
+        draws = np.clip(self._rng.standard_normal(length + 1) * (2 / 6), -1, 1)
+        draws = draws.astype(np.float32)
+        current, targets = draws[0], draws[1:]
+
+        # The EMA current = s * current + (1 - s) * target is a first-order
+        # IIR filter with impulse response s**k, so the whole recursion is
+        # one truncated convolution plus the decaying starting value
+        decay = _ema_decay(length, smoothness)
+        noise = np.convolve(targets, decay[:length])[:length] * (1 - smoothness)
+        noise += current * decay[1:]
         return noise
@@ -5,7 +5,10 @@ from typing import Optional
 
 import numpy as np
 
-from utils import create_rng, clamp
+from utils import create_rng
+
+# Standard normals prefilled per bulk draw for click positions (two per click)
+_NORMAL_BUFFER_SIZE = 1024
 
 
 @dataclass
@@ -49,6 +52,10 @@ class ClickHandler:
         self.config = config or ClickConfig()
         self._rng = create_rng()
 
+        # Prefilled standard normals for click positions, refilled lazily
+        self._normals: list[float] = []
+        self._normal_index = 0
+
     def calculate_click(self, target: ClickTarget) -> ClickResult:
         """Calculate randomized click position and duration.
 
@@ -79,18 +86,37 @@ class ClickHandler:
         sigma_y = target.height / self.config.position_sigma_ratio
 
         # Generate position with Gaussian distribution
-        x = self._rng.normal(target.center_x, sigma_x)
-        y = self._rng.normal(target.center_y, sigma_y)
+        z_x, z_y = self._next_normal_pair()
+        x = target.center_x + sigma_x * z_x
+        y = target.center_y + sigma_y * z_y
 
         # Clamp to target bounds
         half_width = target.width / 2
         half_height = target.height / 2
 
-        x = clamp(x, target.center_x - half_width, target.center_x + half_width)
-        y = clamp(y, target.center_y - half_height, target.center_y + half_height)
+        x = min(max(x, target.center_x - half_width), target.center_x + half_width)
+        y = min(max(y, target.center_y - half_height), target.center_y + half_height)
 
         return int(round(x)), int(round(y))
 
+    def _next_normal_pair(self) -> tuple[float, float]:
+        """Take two standard normals from the prefilled buffer.
+
+        The buffer is refilled with one bulk draw when it runs out, so most
+        clicks make no RNG call at all.
+        """
+        index = self._normal_index
+        if index + 2 > len(self._normals):
+            self._refill_normals()
+            index = 0
+        self._normal_index = index + 2
+        return self._normals[index], self._normals[index + 1]
+
+    def _refill_normals(self) -> None:
+        """Refill the click-position normal buffer in a single RNG call."""
+        self._normals = self._rng.standard_normal(_NORMAL_BUFFER_SIZE).tolist()
+        self._normal_index = 0
+
     def _randomize_duration(self) -> float:
         """Generate randomized click duration using Gamma distribution.
 
@@ -137,8 +163,8 @@ class ClickHandler:
             (dx, dy) offset in pixels
         """
         # Misclicks typically nearby but wrong slot
-        angle = self._rng.uniform(0, 2 * np.pi)
-        distance = self._rng.uniform(20, 50)
+        # Angle and distance drawn together in one call
+        angle, distance = self._rng.uniform((0, 20), (2 * np.pi, 50)).tolist()
 
         dx = int(distance * np.cos(angle))
         dy = int(distance * np.sin(angle))
@@ -9,14 +9,27 @@ from .base import MouseDriverProtocol, KeyboardDriverProtocol
 
 logger = logging.getLogger(__name__)
 
+# Driver instances already created, keyed by kind ("mouse" or "keyboard").
+# The platform alone selects the driver (driver_name and config are not used
+# yet), so there is one instance of each kind
+_DRIVER_CACHE: Dict[str, Any] = {}
+
 
 class DriverFactory:
     """Factory for creating mouse and keyboard drivers.
 
     Production (Windows): Uses Interception for kernel-level input.
     Development (Linux): Uses pynput for testing.
+
+    Drivers are cached per kind, so repeated requests share one instance
+    instead of re-importing and reopening the device.
     """
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget cached drivers so the next request creates fresh instances."""
+        _DRIVER_CACHE.clear()
+
     @classmethod
     def create_mouse_driver(
         cls,
@@ -33,8 +46,16 @@ class DriverFactory:
             config: Optional driver-specific configuration
 
         Returns:
-            Mouse driver instance
+            Mouse driver instance (shared by every call)
         """
+        driver = _DRIVER_CACHE.get("mouse")
+        if driver is None:
+            driver = _DRIVER_CACHE["mouse"] = cls._new_mouse_driver()
+        return driver
+
+    @classmethod
+    def _new_mouse_driver(cls) -> MouseDriverProtocol:
+        """Instantiate the mouse driver for this platform."""
         if sys.platform == "win32":
             # Windows: Interception required
             from .interception_driver import InterceptionMouseDriver
@@ -64,8 +85,16 @@ class DriverFactory:
             config: Optional driver-specific configuration
 
         Returns:
-            Keyboard driver instance
+            Keyboard driver instance (shared by every call)
         """
+        driver = _DRIVER_CACHE.get("keyboard")
+        if driver is None:
+            driver = _DRIVER_CACHE["keyboard"] = cls._new_keyboard_driver()
+        return driver
+
+    @classmethod
+    def _new_keyboard_driver(cls) -> KeyboardDriverProtocol:
+        """Instantiate the keyboard driver for this platform."""
         if sys.platform == "win32":
             # Windows: Interception required
             from .interception_driver import InterceptionKeyboardDriver
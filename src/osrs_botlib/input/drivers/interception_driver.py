@@ -17,8 +17,10 @@ Installation:
 4. pip install interception-python
 """
 
+import functools
 import logging
 import time
+from array import array
 from typing import Tuple, Optional
 
 from .base import MouseButton
@@ -26,10 +28,74 @@ from .base import MouseButton
 
 logger = logging.getLogger(__name__)
 
+# Character to scan code (US keyboard layout)
+_CHAR_SCAN_CODES = {
+    'a': 0x1E, 'b': 0x30, 'c': 0x2E, 'd': 0x20, 'e': 0x12,
+    'f': 0x21, 'g': 0x22, 'h': 0x23, 'i': 0x17, 'j': 0x24,
+    'k': 0x25, 'l': 0x26, 'm': 0x32, 'n': 0x31, 'o': 0x18,
+    'p': 0x19, 'q': 0x10, 'r': 0x13, 's': 0x1F, 't': 0x14,
+    'u': 0x16, 'v': 0x2F, 'w': 0x11, 'x': 0x2D, 'y': 0x15,
+    'z': 0x2C,
+    '1': 0x02, '2': 0x03, '3': 0x04, '4': 0x05, '5': 0x06,
+    '6': 0x07, '7': 0x08, '8': 0x09, '9': 0x0A, '0': 0x0B,
+}
+
+# Same table indexed by ASCII code point (0 = unmapped); uppercase letters
+# share their lowercase scan code
+_ASCII_SCAN_CODES = array('B', bytes(128))
+for _char, _code in _CHAR_SCAN_CODES.items():
+    _ASCII_SCAN_CODES[ord(_char)] = _code
+    _ASCII_SCAN_CODES[ord(_char.upper())] = _code
+del _char, _code
+
+
+@functools.lru_cache(maxsize=1)
+def _special_scan_codes() -> dict:
+    """Build the pynput Key to scan code table on first use.
 
+    Returns:
+        Mapping of special keys to hardware scan codes (not virtual key codes)
+    """
+    # Import here to avoid circular dependency
+    from pynput.keyboard import Key as PynputKey
+
+    return {
+        PynputKey.esc: 0x01,
+        PynputKey.f1: 0x3B,
+        PynputKey.f2: 0x3C,
+        PynputKey.f3: 0x3D,
+        PynputKey.f4: 0x3E,
+        PynputKey.f5: 0x3F,
+        PynputKey.f6: 0x40,
+        PynputKey.f7: 0x41,
+        PynputKey.f8: 0x42,
+        PynputKey.f9: 0x43,
+        PynputKey.f10: 0x44,
+        PynputKey.f11: 0x57,
+        PynputKey.f12: 0x58,
+        PynputKey.backspace: 0x0E,
+        PynputKey.tab: 0x0F,
+        PynputKey.enter: 0x1C,
+        PynputKey.shift: 0x2A,
+        PynputKey.shift_l: 0x2A,
+        PynputKey.shift_r: 0x36,
+        PynputKey.ctrl: 0x1D,
+        PynputKey.ctrl_l: 0x1D,
+        PynputKey.ctrl_r: 0x1D,  # Extended
+        PynputKey.alt: 0x38,
+        PynputKey.alt_l: 0x38,
+        PynputKey.alt_r: 0x38,  # Extended
+        PynputKey.space: 0x39,
+        PynputKey.caps_lock: 0x3A,
+    }
+
+
+@functools.lru_cache(maxsize=1)
 def check_interception_available() -> bool:
     """Check if Interception is available.
 
+    The result is cached: driver install status doesn't change mid-process.
+
     Returns:
         True if Interception can be used
     """
@@ -269,59 +335,19 @@ class InterceptionKeyboardDriver:
         Returns:
             Scan code
         """
-        # Import here to avoid circular dependency
-        from pynput.keyboard import Key as PynputKey
-
-        # Virtual key to scan code mapping (common keys)
-        # These are hardware scan codes, not virtual key codes
-        SCAN_CODES = {
-            PynputKey.esc: 0x01,
-            PynputKey.f1: 0x3B,
-            PynputKey.f2: 0x3C,
-            PynputKey.f3: 0x3D,
-            PynputKey.f4: 0x3E,
-            PynputKey.f5: 0x3F,
-            PynputKey.f6: 0x40,
-            PynputKey.f7: 0x41,
-            PynputKey.f8: 0x42,
-            PynputKey.f9: 0x43,
-            PynputKey.f10: 0x44,
-            PynputKey.f11: 0x57,
-            PynputKey.f12: 0x58,
-            PynputKey.backspace: 0x0E,
-            PynputKey.tab: 0x0F,
-            PynputKey.enter: 0x1C,
-            PynputKey.shift: 0x2A,
-            PynputKey.shift_l: 0x2A,
-            PynputKey.shift_r: 0x36,
-            PynputKey.ctrl: 0x1D,
-            PynputKey.ctrl_l: 0x1D,
-            PynputKey.ctrl_r: 0x1D,  # Extended
-            PynputKey.alt: 0x38,
-            PynputKey.alt_l: 0x38,
-            PynputKey.alt_r: 0x38,  # Extended
-            PynputKey.space: 0x39,
-            PynputKey.caps_lock: 0x3A,
-        }
-
-        if key in SCAN_CODES:
-            return SCAN_CODES[key]
-
-        # Character to scan code (US keyboard layout)
-        CHAR_SCAN_CODES = {
-            'a': 0x1E, 'b': 0x30, 'c': 0x2E, 'd': 0x20, 'e': 0x12,
-            'f': 0x21, 'g': 0x22, 'h': 0x23, 'i': 0x17, 'j': 0x24,
-            'k': 0x25, 'l': 0x26, 'm': 0x32, 'n': 0x31, 'o': 0x18,
-            'p': 0x19, 'q': 0x10, 'r': 0x13, 's': 0x1F, 't': 0x14,
-            'u': 0x16, 'v': 0x2F, 'w': 0x11, 'x': 0x2D, 'y': 0x15,
-            'z': 0x2C,
-            '1': 0x02, '2': 0x03, '3': 0x04, '4': 0x05, '5': 0x06,
-            '6': 0x07, '7': 0x08, '8': 0x09, '9': 0x0A, '0': 0x0B,
-        }
-
-        if isinstance(key, str) and len(key) == 1:
-            code = CHAR_SCAN_CODES.get(key.lower())
-            if code:
+        if isinstance(key, str):
+            if len(key) == 1:
+                # ASCII characters: one indexed load from the prebuilt table
+                char_code = ord(key)
+                if char_code < 128:
+                    code = _ASCII_SCAN_CODES[char_code]
+                else:
+                    code = _CHAR_SCAN_CODES.get(key.lower(), 0)
+                if code:
+                    return code
+        else:
+            code = _special_scan_codes().get(key)
+            if code is not None:
                 return code
 
         logger.warning("Unknown key for Interception: %s", key)
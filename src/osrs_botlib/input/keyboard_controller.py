@@ -19,6 +19,16 @@ class KeyboardController:
     - ydotool: Linux-only, uses kernel uinput (less detectable)
     """
 
+    # Function keys by number (F1-F12)
+    _F_KEYS = {
+        1: Key.f1, 2: Key.f2, 3: Key.f3, 4: Key.f4,
+        5: Key.f5, 6: Key.f6, 7: Key.f7, 8: Key.f8,
+        9: Key.f9, 10: Key.f10, 11: Key.f11, 12: Key.f12,
+    }
+
+    # Number key characters, indexed by digit
+    _NUMBER_KEYS = tuple(str(i) for i in range(10))
+
     def __init__(
         self,
         driver_name: str = "pynput",
@@ -207,7 +217,7 @@ class KeyboardController:
         if not 0 <= number <= 9:
             return False
 
-        return self.press_key(str(number), pre_delay=pre_delay)
+        return self.press_key(self._NUMBER_KEYS[number], pre_delay=pre_delay)
 
     def press_f_key(self, number: int, pre_delay: bool = True) -> bool:
         """Press a function key (F1-F12).
@@ -222,13 +232,7 @@ class KeyboardController:
         if not 1 <= number <= 12:
             return False
 
-        f_keys = {
-            1: Key.f1, 2: Key.f2, 3: Key.f3, 4: Key.f4,
-            5: Key.f5, 6: Key.f6, 7: Key.f7, 8: Key.f8,
-            9: Key.f9, 10: Key.f10, 11: Key.f11, 12: Key.f12,
-        }
-
-        return self.press_key(f_keys[number], pre_delay=pre_delay)
+        return self.press_key(self._F_KEYS[number], pre_delay=pre_delay)
 
     def hold_shift(self) -> None:
         """Press and hold Shift key."""
@@ -16,7 +16,7 @@ from typing import Optional
 
 import numpy as np
 
-from utils import gaussian_bounded
+from utils import gaussian_bounded, gaussian_bounded_batch
 
 
 @dataclass
@@ -69,34 +69,41 @@ class OrganicEasing:
         """
         cfg = self.config
 
-        # Inflection point: where acceleration peaks (Gaussian for natural clustering)
-        inflection = gaussian_bounded(self._rng, cfg.inflection_range[0], cfg.inflection_range[1])
+        # Every parameter comes from one batched truncated-Gaussian draw
+        # (Gaussian for natural clustering), in the order listed here
+        octave_bounds = [
+            bounds
+            for i in range(cfg.noise_octaves)
+            for bounds in (
+                (1.5 + i * 1.5, 3.0 + i * 2.0),  # freq
+                (0.01, 0.04),                    # amp
+                (0, 2 * math.pi),                # phase
+            )
+        ]
+        draws = gaussian_bounded_batch(
+            self._rng,
+            [cfg.inflection_range, cfg.power_range, cfg.power_range, cfg.amplitude_range]
+            + octave_bounds
+            + [cfg.perturbation_strength_range, cfg.drift_rate_range, cfg.drift_curve_range],
+        )
 
+        # Inflection point: where acceleration peaks
         # Asymmetric rise/fall powers (avoids perfect quadratic)
-        rise_power = gaussian_bounded(self._rng, cfg.power_range[0], cfg.power_range[1])
-        fall_power = gaussian_bounded(self._rng, cfg.power_range[0], cfg.power_range[1])
-
         # Overall amplitude variation
-        amplitude = gaussian_bounded(self._rng, cfg.amplitude_range[0], cfg.amplitude_range[1])
-
-        # Generate noise octaves with random frequencies/amplitudes/phases (Gaussian)
-        noise_octaves = []
-        for i in range(cfg.noise_octaves):
-            octave = {
-                'freq': gaussian_bounded(self._rng, 1.5 + i * 1.5, 3.0 + i * 2.0),
-                'amp': gaussian_bounded(self._rng, 0.01, 0.04) / (i + 1),  # Decreasing amplitude
-                'phase': gaussian_bounded(self._rng, 0, 2 * math.pi),
+        inflection, rise_power, fall_power, amplitude = draws[:4]
+
+        # Noise octaves with random frequencies/amplitudes/phases
+        noise_octaves = [
+            {
+                'freq': draws[4 + 3 * i],
+                'amp': draws[5 + 3 * i] / (i + 1),  # Decreasing amplitude
+                'phase': draws[6 + 3 * i],
             }
-            noise_octaves.append(octave)
-
-        # Perturbation strength
-        perturbation_strength = gaussian_bounded(
-            self._rng, cfg.perturbation_strength_range[0], cfg.perturbation_strength_range[1]
-        )
+            for i in range(cfg.noise_octaves)
+        ]
 
-        # Drift parameters
-        drift_rate = gaussian_bounded(self._rng, cfg.drift_rate_range[0], cfg.drift_rate_range[1])
-        drift_curve = gaussian_bounded(self._rng, cfg.drift_curve_range[0], cfg.drift_curve_range[1])
+        # Perturbation strength and drift parameters
+        perturbation_strength, drift_rate, drift_curve = draws[-3:]
 
         # Distance-based adjustments
         # Short movements: more erratic, larger relative perturbations
@@ -157,6 +164,10 @@ class OrganicEasing:
         Returns:
             Perturbation value (small, typically -0.08 to 0.08)
         """
+        # Module lookups bound once, outside the per-octave loop
+        sin = math.sin
+        pi = math.pi
+
         value = 0.0
         for octave in params['noise_octaves']:
             frequency = octave['freq']
@@ -164,7 +175,7 @@ class OrganicEasing:
             phase = octave['phase']
 
             # Smooth wave with random characteristics
-            value += amplitude * math.sin(t * frequency * math.pi + phase)
+            value += amplitude * sin(t * frequency * pi + phase)
 
         return value * params['perturbation_strength'] * 10  # Scale up for effect
 
@@ -201,6 +212,11 @@ class OrganicEasing:
         # Generate unique parameters for this movement
         params = self._generate_movement_params(movement_distance)
 
+        # Bound methods resolved once here rather than on every call
+        organic_base = self._organic_base
+        smooth_perturbation = self._smooth_perturbation
+        micro_drift = self._micro_drift
+
         def organic_ease(t: float) -> float:
             # Handle edge cases
             if t <= 0:
@@ -209,13 +225,13 @@ class OrganicEasing:
                 return 1.0
 
             # Base shape (rough approximation of slow-fast-slow)
-            base = self._organic_base(t, params)
+            base = organic_base(t, params)
 
             # Add smooth perturbations
-            perturbation = self._smooth_perturbation(t, params)
+            perturbation = smooth_perturbation(t, params)
 
             # Add micro-drift
-            drift = self._micro_drift(t, params)
+            drift = micro_drift(t, params)
 
             # Combine components
             # Scale to roughly match expected easing range (0 at start, 1 at end)
@@ -226,7 +242,7 @@ class OrganicEasing:
 
         return organic_ease
 
-    def generate_base_profile(self, num_segments: int, movement_distance: float = 100) -> list[float]:
+    def generate_base_profile(self, num_segments: int, movement_distance: float = 100) -> np.ndarray:
         """Generate an organic base speed profile for a movement.
 
         Replaces the perfect sin(progress * pi) base curve used in
@@ -237,27 +253,14 @@ class OrganicEasing:
             movement_distance: Distance in pixels
 
         Returns:
-            List of base speed factors (0 to 1, representing slow to fast)
+            Array of base speed factors (0 to 1, representing slow to fast)
         """
         params = self._generate_movement_params(movement_distance)
 
-        profile = []
-        for i in range(num_segments):
-            t = i / num_segments if num_segments > 0 else 0
-
-            # Generate organic base value (replaces sin(t * pi))
-            base = self._organic_base(t, params)
-
-            # Add perturbation for variation
-            perturbation = self._smooth_perturbation(t, params)
-
-            # Combine
-            value = base + perturbation
-
-            # Ensure valid range (0.05 minimum to prevent infinite delays)
-            profile.append(max(0.05, min(1.0, value)))
-
-        return profile
+        # Organic base plus perturbation over every segment at once
+        # (replaces sin(t * pi))
+        progress = np.arange(num_segments) / num_segments
+        return self._organic_profile_array(progress, params)
 
     def generate_easing_params_for_speed_profile(self, movement_distance: float = 100) -> dict:
         """Generate parameters for use in _generate_speed_profile.
@@ -313,3 +316,49 @@ class OrganicEasing:
 
         # Combine and clamp
         return max(0.05, min(1.0, base + perturbation))
+
+    def apply_organic_base_array(self, progress: np.ndarray, profile_params: dict) -> np.ndarray:
+        """Vectorized apply_organic_base over an array of progress points.
+
+        Args:
+            progress: Array of progress values (0 to 1)
+            profile_params: Parameters from generate_easing_params_for_speed_profile
+
+        Returns:
+            Array of base speed factors (0 to 1)
+        """
+        return self._organic_profile_array(progress, profile_params['perturbation_params'])
+
+    def _organic_profile_array(self, progress: np.ndarray, params: dict) -> np.ndarray:
+        """Organic base plus smooth perturbation, clamped, over an array of progress points.
+
+        Args:
+            progress: Array of progress values (0 to 1)
+            params: Movement parameters
+
+        Returns:
+            Array of base speed factors (0.05 to 1)
+        """
+        inflection = params['inflection']
+
+        # Organic base: rising and falling phases, each clamped to its own side
+        # of the inflection so neither power sees a negative base
+        rising = np.minimum(progress / inflection, 1.0) ** params['rise_power']
+        falling = 1 - np.maximum(
+            (progress - inflection) / (1 - inflection), 0.0
+        ) ** params['fall_power']
+        base = np.where(progress < inflection, rising, falling) * params['amplitude']
+
+        # Perturbation: every noise octave evaluated in one (octaves, N) block,
+        # in the precision of progress (float32 input stays float32)
+        octaves = params['noise_octaves']
+        frequencies = np.array([octave['freq'] for octave in octaves], dtype=progress.dtype)
+        amplitudes = np.array([octave['amp'] for octave in octaves], dtype=progress.dtype)
+        phases = np.array([octave['phase'] for octave in octaves], dtype=progress.dtype)
+        waves = np.sin(
+            np.multiply.outer(frequencies * math.pi, progress) + phases[:, np.newaxis]
+        )
+        perturbation = (amplitudes @ waves) * (params['perturbation_strength'] * 10)
+
+        # Combine and clamp (0.05 minimum to prevent infinite delays)
+        return np.clip(base + perturbation, 0.05, 1.0)
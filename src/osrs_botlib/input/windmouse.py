@@ -123,7 +123,7 @@ class WindMouse:
         path = [WindMousePoint(int(x), int(y), 0)]
 
         # Calculate total distance for progress tracking
-        initial_distance = math.sqrt((target_x - x) ** 2 + (target_y - y) ** 2)
+        initial_distance = math.hypot(target_x - x, target_y - y)
         if initial_distance < 1:
             return path
 
@@ -137,7 +137,7 @@ class WindMouse:
             # Calculate distance to target
             dx = target_x - x
             dy = target_y - y
-            distance = math.sqrt(dx * dx + dy * dy)
+            distance = math.hypot(dx, dy)
 
             # Check if we've reached the target
             if distance < 1:
@@ -176,7 +176,7 @@ class WindMouse:
             vel_y += wind_y * wind_factor
 
             # Calculate current speed
-            speed = math.sqrt(vel_x * vel_x + vel_y * vel_y)
+            speed = math.hypot(vel_x, vel_y)
 
             # Limit maximum speed
             max_speed = self._calculate_max_speed(
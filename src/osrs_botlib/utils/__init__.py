@@ -6,7 +6,7 @@ with no dependencies on business logic to prevent circular imports.
 
 from .random_utils import create_rng
 from .math_utils import clamp, clamp_point, distance
-from .stats_utils import gamma_delay, gaussian_bounded
+from .stats_utils import gamma_delay, gaussian_bounded, gaussian_bounded_batch
 from .constants import BANK_BG_COLOR_BGR
 
 __all__ = [
@@ -16,5 +16,6 @@ __all__ = [
     "distance",
     "gamma_delay",
     "gaussian_bounded",
+    "gaussian_bounded_batch",
     "BANK_BG_COLOR_BGR",
 ]
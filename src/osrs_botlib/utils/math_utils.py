@@ -52,6 +52,4 @@ def distance(x1: Union[int, float], y1: Union[int, float], x2: Union[int, float]
     Returns:
         Distance between points
     """
-    dx = x2 - x1
-    dy = y2 - y1
-    return math.sqrt(dx * dx + dy * dy)
+    return math.hypot(x2 - x1, y2 - y1)
@@ -1,5 +1,7 @@
 """Statistical distribution utilities."""
 
+from typing import Sequence
+
 import numpy as np
 
 
@@ -72,3 +74,28 @@ def gaussian_bounded(
     # Generate Gaussian value and clamp to bounds
     value = rng.normal(mean, std)
     return max(min_val, min(max_val, value))
+
+
+def gaussian_bounded_batch(
+    rng: np.random.Generator,
+    bounds: Sequence[tuple[float, float]],
+) -> list[float]:
+    """Draw several truncated Gaussian values with a single RNG call.
+
+    Each value has the distribution gaussian_bounded gives for its
+    (min, max) pair: mean at the midpoint, std ~1/6 of the range. Only
+    the standard normals come from NumPy; scaling and clamping stay in
+    plain Python, which beats array ops at these (handful-of-values) sizes.
+
+    Args:
+        rng: NumPy random generator
+        bounds: (min_val, max_val) pair for each value to draw
+
+    Returns:
+        List of values, each clamped to its own bounds
+    """
+    normals = rng.standard_normal(len(bounds)).tolist()
+    return [
+        max(min_val, min(max_val, (min_val + max_val) / 2 + z * (max_val - min_val) / 6))
+        for z, (min_val, max_val) in zip(normals, bounds)
+    ]
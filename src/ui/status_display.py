@@ -382,7 +382,7 @@ class StatusDisplay:
         lines = []
         session_start = time.time()
         if self._aggregator._session:
-            session_start = time.time() - self._aggregator._session.get_session_duration()
+            session_start -= self._aggregator._session.get_session_duration()
 
         for event in events:
             # Format timestamp relative to session start
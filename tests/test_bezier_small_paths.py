@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Test Bezier path generation with very few points.
+
+Every curve type (multi-segment, overshoot, quadratic, cubic) must still
+produce a valid path ending on the target when the caller asks for only
+a handful of points.
+
+Run from osrs_herblore directory:
+    python tests/test_bezier_small_paths.py
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+# Add src/osrs_botlib to path (bezier_movement imports its sibling utils package)
+project_root = Path(__file__).parent.parent
+botlib_root = project_root / "src" / "osrs_botlib"
+sys.path.insert(0, str(botlib_root))
+
+# Register the input package without running its __init__ to avoid package
+# init issues (it imports pynput, which needs a display)
+input_dir = botlib_root / "input"
+spec = importlib.util.spec_from_file_location(
+    "input", str(input_dir / "__init__.py"),
+    submodule_search_locations=[str(input_dir)],
+)
+sys.modules["input"] = importlib.util.module_from_spec(spec)
+
+from input.bezier_movement import BezierMovement, MovementConfig
+
+
+START = (100, 100)
+END = (300, 200)
+
+
+def _check_small_paths(config: MovementConfig, repeats: int = 20):
+    """Generate paths for num_points 1-10 and check each one ends on target."""
+    bezier = BezierMovement(config)
+    for num_points in range(1, 11):
+        for _ in range(repeats):
+            path = bezier.generate_path(START, END, num_points)
+            assert len(path) >= 1, f"num_points={num_points}: empty path"
+            assert path[-1] == END, f"num_points={num_points}: ends at {path[-1]}"
+
+
+def test_multi_segment_small_paths():
+    """Multi-segment curves with fewer points than segments need."""
+    config = MovementConfig()
+    config.multi_segment_chance = 1.0
+    config.overshoot_chance = 0.0
+    config.simple_curve_chance = 0.0
+    _check_small_paths(config)
+
+
+def test_overshoot_small_paths():
+    """Overshoot needs at least 2 points per leg."""
+    config = MovementConfig()
+    config.overshoot_chance = 1.0
+    _check_small_paths(config)
+
+
+def test_quadratic_small_paths():
+    """Quadratic curves with very few points."""
+    config = MovementConfig()
+    config.simple_curve_chance = 1.0
+    config.overshoot_chance = 0.0
+    _check_small_paths(config)
+
+
+def test_cubic_small_paths():
+    """Standard cubic curves with very few points."""
+    config = MovementConfig()
+    config.multi_segment_chance = 0.0
+    config.overshoot_chance = 0.0
+    config.simple_curve_chance = 0.0
+    _check_small_paths(config)
+
+
+def main():
+    """Run all small-path tests."""
+    tests = [
+        test_multi_segment_small_paths,
+        test_overshoot_small_paths,
+        test_quadratic_small_paths,
+        test_cubic_small_paths,
+    ]
+    failed = 0
+    for test in tests:
+        try:
+            test()
+            print(f"✓ {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"✗ {test.__name__}: {e}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())